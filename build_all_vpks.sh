@@ -82,6 +82,7 @@ build_voice_vpk() {
     cp lilith_daemons/voice/whisperer_integration.py "$vpk_dir/eboot/"
     cp lilith_daemons/voice/voice_config.yaml "$vpk_dir/eboot/"
     cp lilith_daemons/voice/phrase_scripts.json "$vpk_dir/eboot/"
+    cp lilithos/vpk_bootstrap.py "$vpk_dir/eboot/"
     
     # Create main entry point
     cat > "$vpk_dir/eboot/main.py" << 'EOF'
@@ -92,40 +93,15 @@ LilithOS Voice Daemon - VPK Entry Point
 
 import sys
 import os
-import logging
 
 # Add current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('lilith_voice.log'),
-        logging.StreamHandler()
-    ]
-)
-
-def main():
-    """Main entry point for VPK."""
-    try:
-        from lilith_voice_daemon import LilithVoiceDaemon
-        
-        print("🎤 Starting LilithOS Voice Daemon...")
-        print("📱 Running on PlayStation Vita")
-        
-        daemon = LilithVoiceDaemon()
-        daemon.run_daemon()
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return 1
-    
-    return 0
+from vpk_bootstrap import launch
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(launch('lilith_voice_daemon', 'LilithVoiceDaemon',
+                    "🎤 Starting LilithOS Voice Daemon...", 'lilith_voice.log'))
 EOF
     
     # Create LiveArea assets
@@ -422,6 +398,7 @@ build_whisperer_vpk() {
     
     # Copy whisperer files
     cp whispurrnet/whispurrnet_daemon.py "$vpk_dir/eboot/"
+    cp lilithos/vpk_bootstrap.py "$vpk_dir/eboot/"
     
     # Create main entry point
     cat > "$vpk_dir/eboot/main.py" << 'EOF'
@@ -432,40 +409,15 @@ LilithOS WhispurrNet - VPK Entry Point
 
 import sys
 import os
-import logging
 
 # Add current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('whispurrnet.log'),
-        logging.StreamHandler()
-    ]
-)
-
-def main():
-    """Main entry point for VPK."""
-    try:
-        from whispurrnet_daemon import WhispurrNetDaemon
-        
-        print("🌐 Starting LilithOS WhispurrNet...")
-        print("📱 Running on PlayStation Vita")
-        
-        daemon = WhispurrNetDaemon()
-        daemon.run_daemon()
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return 1
-    
-    return 0
+from vpk_bootstrap import launch
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(launch('whispurrnet_daemon', 'WhispurrNetDaemon',
+                    "🌐 Starting LilithOS WhispurrNet...", 'whispurrnet.log'))
 EOF
     
     # Create LiveArea assets
@@ -5,14 +5,12 @@ LilithOS Voice Daemon - VPK Entry Point
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from lilith_voice_daemon import LilithVoiceDaemon
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def main():
-    print("🎤 Starting LilithOS Voice Daemon...")
-    daemon = LilithVoiceDaemon()
-    daemon.run_daemon()
+from vpk_bootstrap import launch
 
 if __name__ == "__main__":
-    main()
+    sys.exit(launch('lilith_voice_daemon', 'LilithVoiceDaemon',
+                    "🎤 Starting LilithOS Voice Daemon...", 'lilith_voice.log'))
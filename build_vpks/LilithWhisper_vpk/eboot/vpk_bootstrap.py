@@ -0,0 +1,48 @@
+"""
+Shared launcher for the Python-based PS Vita VPK entry points.
+
+Each VPK's ``eboot/main.py`` delegates to :func:`launch` so the logging setup
+and error handling live in one place, and the daemon module is only imported
+once the launcher actually runs.
+"""
+
+import importlib
+import logging
+
+
+def launch(module_name, daemon_cls_name, banner, log_file):
+    """
+    Configure logging, import the daemon lazily and run it.
+
+    Args:
+        module_name: Module in the eboot directory that defines the daemon
+        daemon_cls_name: Name of the daemon class inside ``module_name``
+        banner: Line printed before the daemon starts
+        log_file: Log file written alongside console output
+
+    Returns:
+        Process exit code (0 on success, 1 on error)
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
+    try:
+        daemon_cls = getattr(importlib.import_module(module_name), daemon_cls_name)
+
+        print(banner)
+        print("📱 Running on PlayStation Vita")
+
+        daemon = daemon_cls()
+        daemon.run_daemon()
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    return 0
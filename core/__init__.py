@@ -22,24 +22,54 @@ import logging
 import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
-import yaml
-import psutil
+import importlib
 import platform
 
-# Core imports
-from .config import ConfigManager
-from .module_manager import ModuleManager
-from .security import SecurityManager
-from .performance import PerformanceMonitor
-from .network import NetworkManager
-from .storage import StorageManager
-from .api import APIManager
-from .events import EventManager
-from .utils import SystemUtils, Logger
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and Linux/macOS only
+    uvloop = None
+
+# Core component classes, imported on first use so that importing a single
+# submodule (e.g. core.divine_bus) does not load the whole stack
+_LAZY_EXPORTS = {
+    'ConfigManager': '.config',
+    'ModuleManager': '.module_manager',
+    'SecurityManager': '.security',
+    'PerformanceMonitor': '.performance',
+    'NetworkManager': '.network',
+    'StorageManager': '.storage',
+    'APIManager': '.api',
+    'EventManager': '.events',
+    'SystemUtils': '.utils',
+    'Logger': '.utils',
+}
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+# psutil is loaded on first use via _psutil()
+psutil = None
+
+def _psutil():
+    """Import psutil on first use"""
+    global psutil
+    if psutil is None:
+        import psutil as psutil_module
+        psutil = psutil_module
+    return psutil
+
+# Minimum interval between psutil samples in get_system_stats (seconds)
+STATS_CACHE_TTL = 0.5
 
 # Version information
 __version__ = "2.0.0"
@@ -78,8 +108,28 @@ class LilithOSCore:
     - Event handling and API management
     """
     
-    def __init__(self, config_path: Optional[str] = None):
-        """Initialize the LilithOS core system"""
+    def __init__(self, config_path: Optional[str] = None, use_uvloop: bool = True):
+        """Initialize the LilithOS core system
+        
+        Args:
+            config_path: Path to the core configuration file
+            use_uvloop: Install uvloop's event loop policy when it is available
+                (Linux/macOS). Only loops created after construction use it.
+        """
+        if use_uvloop:
+            install_uvloop()
+        
+        from .config import ConfigManager
+        from .module_manager import ModuleManager
+        from .security import SecurityManager
+        from .performance import PerformanceMonitor
+        from .network import NetworkManager
+        from .storage import StorageManager
+        from .api import APIManager
+        from .events import EventManager
+        from .utils import SystemUtils, Logger
+        psutil = _psutil()
+        
         self.config_path = config_path or "config/core_config.yaml"
         self.status = SystemStatus.INITIALIZING
         self.start_time = time.time()
@@ -96,6 +146,18 @@ class LilithOSCore:
         self.events = EventManager(self)
         self.utils = SystemUtils(self)
         
+        # Host facts that do not change while running; sampled once
+        self._static_info = SystemInfo(
+            platform=platform.system(),
+            version=platform.version(),
+            architecture=platform.machine(),
+            cpu_count=psutil.cpu_count(),
+            memory_total=psutil.virtual_memory().total,
+            disk_total=psutil.disk_usage('/').total if os.path.exists('/') else 0
+        )
+        self._stats_sample: Optional[tuple] = None  # (monotonic time, (mem %, cpu %, disk %))
+        psutil.cpu_percent(interval=None)  # prime the non-blocking CPU counter
+        
         # System information
         self.system_info = self._get_system_info()
         
@@ -107,13 +169,15 @@ class LilithOSCore:
     
     def _get_system_info(self) -> SystemInfo:
         """Get current system information"""
+        psutil = _psutil()
+        static = self._static_info
         return SystemInfo(
-            platform=platform.system(),
-            version=platform.version(),
-            architecture=platform.machine(),
-            cpu_count=psutil.cpu_count(),
-            memory_total=psutil.virtual_memory().total,
-            disk_total=psutil.disk_usage('/').total if os.path.exists('/') else 0,
+            platform=static.platform,
+            version=static.version,
+            architecture=static.architecture,
+            cpu_count=static.cpu_count,
+            memory_total=static.memory_total,
+            disk_total=static.disk_total,
             uptime=time.time() - self.start_time,
             load_average=psutil.getloadavg() if hasattr(psutil, 'getloadavg') else [0, 0, 0]
         )
@@ -126,6 +190,12 @@ class LilithOSCore:
             
             # Initialize core services
             await self.config.load()
+            
+            # Pin the event loop thread before any tasks or worker threads start
+            affinity = self.config.get('core.affinity')
+            if affinity:
+                self._set_cpu_affinity(affinity)
+            
             await self.security.initialize()
             await self.performance.start()
             await self.network.initialize()
@@ -145,6 +215,26 @@ class LilithOSCore:
             self.logger.error(f"Failed to start LilithOS Core: {e}")
             return False
     
+    def _set_cpu_affinity(self, cpus: Union[int, List[int]]) -> bool:
+        """Pin the calling (event loop) thread to the given CPUs (config key core.affinity).
+
+        Accepts a single CPU index or a list of them. On Linux sched_setaffinity(0)
+        only affects the calling thread: threads started afterwards inherit the
+        mask, threads already running keep theirs.
+        """
+        psutil = _psutil()
+        try:
+            cpus = [cpus] if isinstance(cpus, int) else list(cpus)
+            if hasattr(os, 'sched_setaffinity'):
+                os.sched_setaffinity(0, set(cpus))
+            else:
+                psutil.Process().cpu_affinity(list(cpus))
+            self.logger.info(f"CPU affinity set to {sorted(cpus)}")
+            return True
+        except (AttributeError, OSError, TypeError, ValueError, psutil.Error) as e:
+            self.logger.warning(f"Could not set CPU affinity {cpus}: {e}")
+            return False
+    
     async def stop(self) -> bool:
         """Stop the LilithOS core system"""
         try:
@@ -200,14 +290,25 @@ class LilithOSCore:
     
     def get_system_stats(self) -> Dict[str, Any]:
         """Get current system statistics"""
+        # Resample psutil at most once per STATS_CACHE_TTL so polling stays cheap
+        now = time.monotonic()
+        if self._stats_sample is None or now - self._stats_sample[0] >= STATS_CACHE_TTL:
+            psutil = _psutil()
+            self._stats_sample = (now, (
+                psutil.virtual_memory().percent,
+                psutil.cpu_percent(interval=None),
+                psutil.disk_usage('/').percent if self._static_info.disk_total else 0
+            ))
+        memory_usage, cpu_usage, disk_usage = self._stats_sample[1]
+        
         return {
             "status": self.status.value,
             "uptime": time.time() - self.start_time,
             "active_modules": len(self.active_modules),
             "total_modules": len(self.modules),
-            "memory_usage": psutil.virtual_memory().percent,
-            "cpu_usage": psutil.cpu_percent(),
-            "disk_usage": psutil.disk_usage('/').percent if os.path.exists('/') else 0,
+            "memory_usage": memory_usage,
+            "cpu_usage": cpu_usage,
+            "disk_usage": disk_usage,
             "system_info": self.system_info.__dict__
         }
     
@@ -235,6 +336,14 @@ class LilithOSCore:
             self.status = SystemStatus.ERROR
             return False
 
+def install_uvloop() -> bool:
+    """Use uvloop for new asyncio event loops if it is installed"""
+    if uvloop is None:
+        return False
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 # Global core instance
 _core_instance: Optional[LilithOSCore] = None
 
@@ -259,6 +368,7 @@ __all__ = [
     'SystemInfo',
     'get_core',
     'initialize_core',
+    'install_uvloop',
     '__version__',
     '__author__',
     '__license__'
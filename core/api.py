@@ -11,20 +11,48 @@ Handles REST API endpoints and request routing:
 """
 
 import os
+import sys
+import socket
 import asyncio
 import logging
 import threading
 import time
 import json
+import hashlib
 import inspect
+from collections import Counter, OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable, Union
+from typing import Dict, List, Mapping, Optional, Any, Callable, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
 import aiohttp
 from aiohttp import web, ClientSession
 from aiohttp_cors import setup as cors_setup, ResourceOptions
+from multidict import CIMultiDict
+
+try:
+    import orjson
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _json_loads = json.loads
+
+def _json_response(data: Any, status: int = 200) -> web.Response:
+    """Build a JSON response using the fastest available encoder"""
+    return web.Response(body=_json_dumps(data), status=status, content_type='application/json')
+
+# Methods whose request body is never read
+_BODILESS_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'DELETE'))
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 class HTTPMethod(Enum):
     """HTTP method enumeration"""
@@ -40,7 +68,7 @@ class APIVersion(Enum):
     V1 = "v1"
     V2 = "v2"
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class APIEndpoint:
     """API endpoint information"""
     path: str
@@ -52,20 +80,46 @@ class APIEndpoint:
     description: str = ""
     parameters: Dict[str, Any] = field(default_factory=dict)
     responses: Dict[str, Any] = field(default_factory=dict)
+    key: str = ""  # "METHOD:/api/vN/path", set at registration
+    is_coro: bool = False  # handler is a coroutine function, set at registration
+    response_mode: str = "auto"  # "response", "json" or "auto"; a hint checked against the result
 
-@dataclass
 class APIRequest:
-    """API request information"""
-    method: str
-    path: str
-    headers: Dict[str, str]
-    query_params: Dict[str, str]
-    body: Optional[Any] = None
-    client_ip: str = ""
-    user_agent: str = ""
-    timestamp: float = field(default_factory=time.time)
+    """API request information
+    
+    Headers and query parameters are read straight from the underlying aiohttp
+    request instead of being copied for every request. Values added by the API
+    layer (such as X-User) go into extra_headers and take precedence.
+    """
+    __slots__ = ('method', 'path', 'body', 'client_ip', 'user_agent', 'timestamp',
+                 'extra_headers', '_request')
+    
+    def __init__(self, request: web.Request, body: Optional[Any] = None, client_ip: str = "",
+                 user_agent: str = "", timestamp: Optional[float] = None):
+        self._request = request
+        self.method = request.method
+        self.path = request.path
+        self.body = body
+        self.client_ip = client_ip
+        self.user_agent = user_agent
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.extra_headers: Dict[str, str] = {}
+    
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Request headers, including any added by the API layer"""
+        if not self.extra_headers:
+            return self._request.headers
+        headers = CIMultiDict(self._request.headers)
+        headers.update(self.extra_headers)
+        return headers
+    
+    @property
+    def query_params(self) -> Mapping[str, str]:
+        """Query string parameters"""
+        return self._request.query
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class APIResponse:
     """API response information"""
     status: int
@@ -73,99 +127,191 @@ class APIResponse:
     headers: Dict[str, str] = field(default_factory=dict)
     timestamp: float = field(default_factory=time.time)
 
+# Number of independently locked rate limiter shards (power of two)
+RATE_LIMIT_SHARDS = 32
+
+# Upper bound on tracked clients; least recently seen clients are dropped first
+RATE_LIMIT_MAX_CLIENTS = 100_000
+
 class RateLimiter:
-    """Handles API rate limiting"""
+    """Handles API rate limiting using a per-client token bucket"""
     
     def __init__(self, api_manager: 'APIManager'):
         self.api_manager = api_manager
-        self.requests: Dict[str, List[float]] = {}
-        self.lock = threading.RLock()
+        # client_id -> (tokens, last refill time), split across shards so
+        # unrelated clients do not contend on one lock
+        self._shards: List['OrderedDict[str, Tuple[float, float]]'] = [
+            OrderedDict() for _ in range(RATE_LIMIT_SHARDS)
+        ]
+        self._shard_capacity = max(1, RATE_LIMIT_MAX_CLIENTS // RATE_LIMIT_SHARDS)
+        self._locks = [threading.Lock() for _ in range(RATE_LIMIT_SHARDS)]
+        self._max_window = 60
     
-    def is_allowed(self, client_id: str, limit: int, window: int = 60) -> bool:
-        """Check if a request is allowed based on rate limit"""
-        try:
-            current_time = time.time()
+    def _shard(self, client_id: str) -> Tuple[threading.Lock, 'OrderedDict[str, Tuple[float, float]]']:
+        """Get the lock and bucket map that own a client"""
+        i = hash(client_id) & (RATE_LIMIT_SHARDS - 1)
+        return self._locks[i], self._shards[i]
+    
+    def is_allowed(self, client_id: str, limit: int, window: int = 60, *,
+                   now: Optional[float] = None) -> bool:
+        """Check if a request is allowed based on rate limit
+        
+        now is a time.monotonic() reading; callers that already have one can pass it.
+        """
+        if now is None:
+            now = time.monotonic()
+        rate = limit / window
+        if window > self._max_window:
+            self._max_window = window
+        
+        lock, buckets = self._shard(client_id)
+        with lock:
+            bucket = buckets.get(client_id)
+            if bucket is None:
+                tokens, last_refill = limit, now
+                if len(buckets) >= self._shard_capacity:
+                    buckets.popitem(last=False)
+            else:
+                tokens, last_refill = bucket
+                buckets.move_to_end(client_id)
+            tokens = min(limit, tokens + (now - last_refill) * rate)
             
-            with self.lock:
-                if client_id not in self.requests:
-                    self.requests[client_id] = []
-                
-                # Remove old requests outside the window
-                self.requests[client_id] = [
-                    req_time for req_time in self.requests[client_id]
-                    if current_time - req_time < window
-                ]
-                
-                # Check if limit exceeded
-                if len(self.requests[client_id]) >= limit:
-                    return False
-                
-                # Add current request
-                self.requests[client_id].append(current_time)
-                return True
-                
-        except Exception as e:
-            self.api_manager.logger.error(f"Rate limiting error: {e}")
-            return True  # Allow request on error
+            if tokens < 1:
+                buckets[client_id] = (tokens, now)
+                return False
+            
+            buckets[client_id] = (tokens - 1, now)
+            return True
     
-    def get_remaining_requests(self, client_id: str, limit: int, window: int = 60) -> int:
+    def get_remaining_requests(self, client_id: str, limit: int, window: int = 60, *,
+                               now: Optional[float] = None) -> int:
         """Get remaining requests for a client"""
-        try:
-            current_time = time.time()
-            
-            with self.lock:
-                if client_id not in self.requests:
-                    return limit
-                
-                # Remove old requests
-                self.requests[client_id] = [
-                    req_time for req_time in self.requests[client_id]
-                    if current_time - req_time < window
-                ]
-                
-                return max(0, limit - len(self.requests[client_id]))
-                
-        except Exception as e:
-            self.api_manager.logger.error(f"Rate limiting error: {e}")
-            return 0
+        if now is None:
+            now = time.monotonic()
+        
+        lock, buckets = self._shard(client_id)
+        with lock:
+            bucket = buckets.get(client_id)
+        
+        if bucket is None:
+            return limit
+        
+        tokens, last_refill = bucket
+        return int(min(limit, tokens + (now - last_refill) * limit / window))
+    
+    def evict_idle(self) -> int:
+        """Drop buckets untouched for a full window (they would be full again)"""
+        now = time.monotonic()
+        evicted = 0
+        for lock, buckets in zip(self._locks, self._shards):
+            with lock:
+                idle = [client_id for client_id, (_, last_refill) in buckets.items()
+                        if now - last_refill >= self._max_window]
+                for client_id in idle:
+                    del buckets[client_id]
+            evicted += len(idle)
+        return evicted
+    
+    async def run_maintenance(self):
+        """Periodically evict idle clients so requests never pay for cleanup"""
+        while True:
+            await asyncio.sleep(self._max_window)
+            try:
+                evicted = self.evict_idle()
+                if evicted and self.api_manager.logger.isEnabledFor(logging.DEBUG):
+                    self.api_manager.logger.debug("Evicted %d idle rate limit buckets", evicted)
+            except Exception as e:
+                self.api_manager.logger.error("Rate limiter maintenance error: %s", e)
+
+# Verified credentials are cached (by hash) for this many seconds
+AUTH_CACHE_TTL = 300
+AUTH_CACHE_MAX = 10_000
 
 class APIAuthenticator:
     """Handles API authentication"""
     
     def __init__(self, api_manager: 'APIManager'):
         self.api_manager = api_manager
+        # blake2b(token) -> (authenticated user, expiry); raw tokens are never stored
+        self._auth_cache: 'OrderedDict[bytes, Tuple[str, float]]' = OrderedDict()
+        self._auth_cache_ttl = AUTH_CACHE_TTL
+        # Drop cached credentials as soon as their session is logged out or expires
+        api_manager.core.security.auth.add_logout_hook(self.invalidate)
     
-    async def authenticate_request(self, request: web.Request) -> Optional[str]:
-        """Authenticate an API request"""
-        try:
-            # Check for API key in headers
-            api_key = request.headers.get('X-API-Key')
-            if api_key:
-                # Validate API key
-                if await self._validate_api_key(api_key):
-                    return api_key
-            
-            # Check for session token
-            session_token = request.headers.get('X-Session-Token')
-            if session_token:
-                # Validate session
-                session = self.api_manager.core.security.auth.validate_session(session_token)
-                if session:
-                    return session["username"]
-            
-            # Check for Bearer token
-            auth_header = request.headers.get('Authorization')
-            if auth_header and auth_header.startswith('Bearer '):
-                token = auth_header[7:]  # Remove 'Bearer ' prefix
-                session = self.api_manager.core.security.auth.validate_session(token)
-                if session:
-                    return session["username"]
-            
+    @staticmethod
+    def _token_hash(token: str) -> bytes:
+        """Hash a credential for use as a cache key"""
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+    
+    def _cache_get(self, key: bytes) -> Optional[str]:
+        """Get a cached user for a credential hash, if still fresh"""
+        entry = self._auth_cache.get(key)
+        if entry is None:
             return None
-            
-        except Exception as e:
-            self.api_manager.logger.error(f"Authentication error: {e}")
+        user, expires = entry
+        if time.monotonic() >= expires:
+            del self._auth_cache[key]
             return None
+        self._auth_cache.move_to_end(key)
+        return user
+    
+    def _cache_put(self, key: bytes, user: str):
+        """Cache a verified credential, evicting the least recently used"""
+        # Never outlive the session timeout so expiry is still enforced by the auth manager
+        ttl = min(self._auth_cache_ttl, self.api_manager.core.security.auth.session_timeout)
+        self._auth_cache[key] = (user, time.monotonic() + ttl)
+        self._auth_cache.move_to_end(key)
+        if len(self._auth_cache) > AUTH_CACHE_MAX:
+            self._auth_cache.popitem(last=False)
+    
+    def invalidate(self, token: str):
+        """Forget a cached credential (run on logout/expiry; call on key revocation)"""
+        self._auth_cache.pop(self._token_hash(token), None)
+    
+    def _validate_session_token(self, token: str) -> Optional[str]:
+        """Resolve a session token to a username, using the cache when possible"""
+        key = self._token_hash(token)
+        user = self._cache_get(key)
+        if user is not None:
+            return user
+        
+        session = self.api_manager.core.security.auth.validate_session(token)
+        if not session:
+            return None
+        
+        self._cache_put(key, session["username"])
+        return session["username"]
+    
+    async def authenticate_request(self, request: web.Request) -> Optional[str]:
+        """Authenticate an API request"""
+        # Check for API key in headers
+        api_key = request.headers.get('X-API-Key')
+        if api_key:
+            # Validate API key (cached with an empty user; the key identifies the caller)
+            key = self._token_hash(api_key)
+            if self._cache_get(key) is not None:
+                return api_key
+            if await self._validate_api_key(api_key):
+                self._cache_put(key, "")
+                return api_key
+        
+        # Check for session token
+        session_token = request.headers.get('X-Session-Token')
+        if session_token:
+            # Validate session
+            user = self._validate_session_token(session_token)
+            if user:
+                return user
+        
+        # Check for Bearer token
+        auth_header = request.headers.get('Authorization')
+        if auth_header and auth_header.startswith('Bearer '):
+            token = auth_header[7:]  # Remove 'Bearer ' prefix
+            user = self._validate_session_token(token)
+            if user:
+                return user
+        
+        return None
     
     async def _validate_api_key(self, api_key: str) -> bool:
         """Validate an API key"""
@@ -175,6 +321,43 @@ class APIAuthenticator:
         # For now, accept any non-empty key
         return bool(api_key and len(api_key) > 0)
 
+# Seconds a polled endpoint's encoded response is reused
+RESPONSE_CACHE_TTL = 0.5
+
+def cached_response(ttl: float) -> Callable:
+    """Serve an APIManager handler's JSON result from cache for ttl seconds"""
+    def decorator(func: Callable) -> Callable:
+        # Keep the wrapper's own return annotation so _response_mode sees a Response
+        @wraps(func, assigned=('__module__', '__name__', '__qualname__', '__doc__'))
+        async def wrapper(self, request: web.Request, api_request: APIRequest) -> web.Response:
+            now = request.get('received_monotonic') or time.monotonic()
+            cached = self._response_cache.get(func.__name__)
+            if cached is None or now - cached[0] >= ttl:
+                cached = (now, _json_dumps(await func(self, request, api_request)))
+                self._response_cache[func.__name__] = cached
+            return web.Response(body=cached[1], content_type='application/json')
+        return wrapper
+    return decorator
+
+def _response_mode(handler: Callable) -> str:
+    """Classify a handler by its return annotation so the likely result check runs first"""
+    try:
+        annotation = inspect.signature(handler, follow_wrapped=False).return_annotation
+    except (TypeError, ValueError):
+        return "auto"
+    if isinstance(annotation, type) and issubclass(annotation, web.StreamResponse):
+        return "response"
+    if getattr(annotation, '__origin__', annotation) is dict:
+        return "json"
+    return "auto"
+
+def _client_ip(request: web.Request) -> str:
+    """Get the originating client IP, honouring X-Forwarded-For"""
+    client_ip = request.headers.get('X-Forwarded-For', request.remote) or ''
+    # First hop only; find() avoids splitting the whole chain
+    idx = client_ip.find(',')
+    return (client_ip[:idx] if idx >= 0 else client_ip).strip()
+
 class APIHandler:
     """Handles API request processing"""
     
@@ -183,103 +366,125 @@ class APIHandler:
         self.authenticator = APIAuthenticator(api_manager)
         self.rate_limiter = RateLimiter(api_manager)
     
+    @property
+    def middlewares(self) -> List[Callable]:
+        """Middlewares to install on the aiohttp app, in order"""
+        return [self.error_middleware, self.route_middleware, self.rate_limit_middleware, self.auth_middleware]
+    
+    @web.middleware
+    async def error_middleware(self, request: web.Request, handler: Callable) -> web.StreamResponse:
+        """Turn unexpected errors in the middlewares below into a logged JSON 500"""
+        try:
+            return await handler(request)
+        except web.HTTPException:
+            raise
+        except Exception:
+            self.api_manager.logger.error("Request processing error for %s %s", request.method, request.path,
+                                          exc_info=True)
+            return _json_response(
+                {"error": "Internal server error"},
+                status=500
+            )
+    
+    @web.middleware
+    async def route_middleware(self, request: web.Request, handler: Callable) -> web.StreamResponse:
+        """Attach the matched APIEndpoint (or None) and the arrival time to the request"""
+        # One monotonic clock read per request, shared by the rate limiter and response cache
+        request['received_monotonic'] = time.monotonic()
+        resource = request.match_info.route.resource
+        request['endpoint'] = None if resource is None else \
+            self.api_manager._endpoints_by_route.get((request.method, resource.canonical))
+        return await handler(request)
+    
+    @web.middleware
+    async def rate_limit_middleware(self, request: web.Request, handler: Callable) -> web.StreamResponse:
+        """Reject requests over the endpoint's rate limit"""
+        endpoint = request['endpoint']
+        if endpoint is not None and endpoint.rate_limit:
+            if not self.rate_limiter.is_allowed(_client_ip(request), endpoint.rate_limit,
+                                                now=request['received_monotonic']):
+                return _json_response(
+                    {"error": "Rate limit exceeded"},
+                    status=429
+                )
+        return await handler(request)
+    
+    @web.middleware
+    async def auth_middleware(self, request: web.Request, handler: Callable) -> web.StreamResponse:
+        """Require authentication for endpoints that ask for it"""
+        endpoint = request['endpoint']
+        if endpoint is not None and endpoint.auth_required:
+            user = await self.authenticator.authenticate_request(request)
+            if not user:
+                return _json_response(
+                    {"error": "Authentication required"},
+                    status=401
+                )
+            request['user'] = user
+        return await handler(request)
+    
     async def handle_request(self, request: web.Request, endpoint: APIEndpoint) -> web.Response:
-        """Handle an API request"""
+        """Handle an API request (rate limiting and auth already ran as middleware)"""
         try:
             # Create API request object
             api_request = await self._create_api_request(request)
-            
-            # Rate limiting
-            if endpoint.rate_limit:
-                client_id = api_request.client_ip
-                if not self.rate_limiter.is_allowed(client_id, endpoint.rate_limit):
-                    return web.json_response(
-                        {"error": "Rate limit exceeded"},
-                        status=429
-                    )
-            
-            # Authentication
-            if endpoint.auth_required:
-                user = await self.authenticator.authenticate_request(request)
-                if not user:
-                    return web.json_response(
-                        {"error": "Authentication required"},
-                        status=401
-                    )
-                api_request.headers['X-User'] = user
+            user = request.get('user')
+            if user:
+                api_request.extra_headers['X-User'] = user
             
             # Process request
-            try:
-                if asyncio.iscoroutinefunction(endpoint.handler):
-                    result = await endpoint.handler(request, api_request)
-                else:
-                    result = endpoint.handler(request, api_request)
-                
-                # Create response
-                if isinstance(result, web.Response):
+            if endpoint.is_coro:
+                result = await endpoint.handler(request, api_request)
+            else:
+                result = endpoint.handler(request, api_request)
+            
+            # Create response; the annotation-derived mode only picks which
+            # check runs first, the returned value decides the encoding
+            if endpoint.response_mode == "response":
+                if isinstance(result, web.StreamResponse):
                     return result
-                elif isinstance(result, dict):
-                    return web.json_response(result)
-                else:
-                    return web.json_response({"data": result})
-                    
-            except Exception as e:
-                self.api_manager.logger.error(f"Request handler error: {e}")
-                return web.json_response(
-                    {"error": "Internal server error"},
-                    status=500
-                )
-                
-        except Exception as e:
-            self.api_manager.logger.error(f"Request processing error: {e}")
-            return web.json_response(
+            elif type(result) is dict:
+                return _json_response(result)
+            
+            if isinstance(result, web.StreamResponse):
+                return result
+            elif isinstance(result, dict):
+                return _json_response(result)
+            else:
+                return _json_response({"data": result})
+            
+        except web.HTTPException:
+            # Deliberate HTTP errors (404, 400, ...) from handlers pass through to aiohttp
+            raise
+        except Exception:
+            self.api_manager.logger.error("Request processing error for %s", endpoint.key, exc_info=True)
+            return _json_response(
                 {"error": "Internal server error"},
                 status=500
             )
     
     async def _create_api_request(self, request: web.Request) -> APIRequest:
         """Create an API request object from aiohttp request"""
-        try:
-            # Get client IP
-            client_ip = request.headers.get('X-Forwarded-For', request.remote)
-            if ',' in client_ip:
-                client_ip = client_ip.split(',')[0].strip()
-            
-            # Get query parameters
-            query_params = dict(request.query)
-            
-            # Get request body
-            body = None
-            if request.content_type == 'application/json':
-                try:
-                    body = await request.json()
-                except:
-                    body = await request.text()
-            elif request.content_type == 'application/x-www-form-urlencoded':
-                body = await request.post()
-            else:
+        # Get request body; bodiless methods and empty bodies skip the read
+        body = None
+        if request.method in _BODILESS_METHODS or request.content_length == 0:
+            pass
+        elif request.content_type == 'application/json':
+            try:
+                body = _json_loads(await request.read())
+            except ValueError:
                 body = await request.text()
-            
-            return APIRequest(
-                method=request.method,
-                path=str(request.path),
-                headers=dict(request.headers),
-                query_params=query_params,
-                body=body,
-                client_ip=client_ip,
-                user_agent=request.headers.get('User-Agent', ''),
-                timestamp=time.time()
-            )
-            
-        except Exception as e:
-            self.api_manager.logger.error(f"Failed to create API request: {e}")
-            return APIRequest(
-                method=request.method,
-                path=str(request.path),
-                headers={},
-                query_params={},
-                body=None
-            )
+        elif request.content_type == 'application/x-www-form-urlencoded':
+            body = await request.post()
+        else:
+            body = await request.text()
+        
+        return APIRequest(
+            request,
+            body=body,
+            client_ip=_client_ip(request),
+            user_agent=request.headers.get('User-Agent', '')
+        )
 
 class APIManager:
     """
@@ -298,10 +503,28 @@ class APIManager:
         self.logger = logging.getLogger("APIManager")
         self.app = web.Application()
         self.handler = APIHandler(self)
+        self.app.middlewares.extend(self.handler.middlewares)
         self.endpoints: Dict[str, APIEndpoint] = {}
+        self._endpoints_by_route: Dict[Tuple[str, str], APIEndpoint] = {}  # (method, path) -> endpoint
+        self._docs_cache: Optional[bytes] = None  # serialized /docs body, reset on registration
+        # Endpoint counts, maintained by register_endpoint for get_api_stats
+        self._by_version: Counter = Counter()
+        self._by_method: Counter = Counter()
+        
+        # Health check body up to the timestamp value, which is filled in per request
+        self._health_prefix = _json_dumps({"status": "healthy", "version": "2.0.0"})[:-1] + b', "timestamp": '
+        
+        # handler name -> (monotonic time, encoded body), see cached_response
+        self._response_cache: Dict[str, Tuple[float, bytes]] = {}
         self.server = None
+        self._rate_limit_task: Optional[asyncio.Task] = None
+        self.client_session: Optional[ClientSession] = None  # shared outbound HTTP pool
         self.port = 8080
         self.host = "localhost"
+        self.backlog = 2048
+        # Share the port with other server processes (SO_REUSEPORT); opt-in via
+        # network.reuse_port so a second instance fails with EADDRINUSE by default
+        self.reuse_port = False
         
         # Setup CORS
         cors = cors_setup(self.app, defaults={
@@ -380,7 +603,7 @@ class APIManager:
         """Register a new API endpoint"""
         try:
             endpoint = APIEndpoint(
-                path=f"/api/{version.value}{path}",
+                path=sys.intern(f"/api/{version.value}{path}"),
                 method=method,
                 handler=handler,
                 version=version,
@@ -391,63 +614,100 @@ class APIManager:
                 responses=responses or {}
             )
             
-            endpoint_key = f"{method.value}:{endpoint.path}"
-            self.endpoints[endpoint_key] = endpoint
+            endpoint.key = f"{method.value}:{endpoint.path}"
+            endpoint.is_coro = asyncio.iscoroutinefunction(handler) or inspect.iscoroutinefunction(handler)
+            endpoint.response_mode = _response_mode(handler)
+            # Register with aiohttp first (it rejects duplicates); every route shares one handler
+            self.app.router.add_route(method.value, endpoint.path, self._dispatch)
+            self.endpoints[endpoint.key] = endpoint
+            self._endpoints_by_route[(method.value, endpoint.path)] = endpoint
+            self._docs_cache = None
+            self._by_version[version.value] += 1
+            self._by_method[method.value] += 1
             
-            # Register with aiohttp
-            self.app.router.add_route(
-                method.value,
-                endpoint.path,
-                lambda req, ep=endpoint: self.handler.handle_request(req, ep)
-            )
-            
-            self.logger.info(f"Registered API endpoint: {method.value} {endpoint.path}")
+            self.logger.info("Registered API endpoint: %s %s", method.value, endpoint.path)
             
         except Exception as e:
-            self.logger.error(f"Failed to register endpoint {path}: {e}")
+            self.logger.error("Failed to register endpoint %s: %s", path, e)
+    
+    async def _dispatch(self, request: web.Request) -> web.Response:
+        """Route a matched aiohttp request to its registered endpoint"""
+        return await self.handler.handle_request(request, request['endpoint'])
     
     async def start(self) -> bool:
         """Start the API server"""
         try:
-            self.logger.info(f"Starting API server on {self.host}:{self.port}")
+            self.logger.info("Starting API server on %s:%s", self.host, self.port)
+            self.reuse_port = bool(self.core.config.get('network.reuse_port', False)) and \
+                hasattr(socket, 'SO_REUSEPORT')
             
             # Create server
             runner = web.AppRunner(self.app)
             await runner.setup()
             
-            self.server = web.TCPSite(runner, self.host, self.port)
+            self.server = web.TCPSite(runner, self.host, self.port,
+                                      backlog=self.backlog, reuse_port=self.reuse_port)
             await self.server.start()
             
+            self._rate_limit_task = asyncio.create_task(self.handler.rate_limiter.run_maintenance())
+            
+            # One pooled session for outbound calls so connections are kept alive
+            connector = aiohttp.TCPConnector(
+                limit=1024,
+                limit_per_host=128,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            self.client_session = ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            
             self.logger.info("API server started successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to start API server: {e}")
+            self.logger.error("Failed to start API server: %s", e)
             return False
     
     async def stop(self) -> bool:
         """Stop the API server"""
         try:
+            if self._rate_limit_task:
+                self._rate_limit_task.cancel()
+                self._rate_limit_task = None
+            
+            if self.client_session:
+                await self.client_session.close()
+                self.client_session = None
+            
             if self.server:
                 await self.server.stop()
                 self.logger.info("API server stopped successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to stop API server: {e}")
+            self.logger.error("Failed to stop API server: %s", e)
             return False
     
     # Default endpoint handlers
-    async def _health_check(self, request: web.Request, api_request: APIRequest) -> Dict[str, Any]:
+    async def _health_check(self, request: web.Request, api_request: APIRequest) -> web.Response:
         """Health check endpoint"""
-        return {
-            "status": "healthy",
-            "timestamp": time.time(),
-            "version": "2.0.0"
-        }
+        # Only the timestamp changes, so splice it into the pre-encoded body
+        return web.Response(
+            body=self._health_prefix + repr(time.time()).encode() + b'}',
+            content_type='application/json'
+        )
     
-    async def _get_documentation(self, request: web.Request, api_request: APIRequest) -> Dict[str, Any]:
+    async def _get_documentation(self, request: web.Request, api_request: APIRequest) -> web.Response:
         """Get API documentation"""
+        if self._docs_cache is None:
+            self._docs_cache = _json_dumps(self._build_documentation())
+        return web.Response(body=self._docs_cache, content_type='application/json')
+    
+    def _build_documentation(self) -> Dict[str, Any]:
+        """Build the API documentation from the registered endpoints"""
         docs = {
             "title": "LilithOS API Documentation",
             "version": "2.0.0",
@@ -471,6 +731,7 @@ class APIManager:
         """Get system status"""
         return self.core.get_system_stats()
     
+    @cached_response(ttl=RESPONSE_CACHE_TTL)
     async def _list_modules(self, request: web.Request, api_request: APIRequest) -> Dict[str, Any]:
         """List all modules"""
         modules = self.core.module_manager.list_modules()
@@ -515,6 +776,7 @@ class APIManager:
             "load_time": module_info.load_time
         }
     
+    @cached_response(ttl=RESPONSE_CACHE_TTL)
     async def _get_metrics(self, request: web.Request, api_request: APIRequest) -> Dict[str, Any]:
         """Get performance metrics"""
         return {
@@ -524,14 +786,14 @@ class APIManager:
             "security": self.core.security.get_system_stats()
         }
     
+    @cached_response(ttl=RESPONSE_CACHE_TTL)
     async def _get_storage_info(self, request: web.Request, api_request: APIRequest) -> Dict[str, Any]:
         """Get storage information"""
         return self.core.storage.get_storage_stats()
     
     def get_endpoint(self, path: str, method: HTTPMethod) -> Optional[APIEndpoint]:
         """Get an endpoint by path and method"""
-        endpoint_key = f"{method.value}:{path}"
-        return self.endpoints.get(endpoint_key)
+        return self._endpoints_by_route.get((method.value, path))
     
     def list_endpoints(self, version: Optional[APIVersion] = None) -> List[APIEndpoint]:
         """List all endpoints, optionally filtered by version"""
@@ -546,11 +808,11 @@ class APIManager:
             "total_endpoints": len(self.endpoints),
             "versions": [version.value for version in APIVersion],
             "endpoints_by_version": {
-                version.value: len([ep for ep in self.endpoints.values() if ep.version == version])
+                version.value: self._by_version[version.value]
                 for version in APIVersion
             },
             "endpoints_by_method": {
-                method.value: len([ep for ep in self.endpoints.values() if ep.method == method])
+                method.value: self._by_method[method.value]
                 for method in HTTPMethod
             }
         } 
\ No newline at end of file
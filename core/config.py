@@ -10,19 +10,50 @@ Handles all system configuration including:
 - Default values management
 """
 
+import copy
 import os
+import re
+import sys
 import yaml
 import json
 import asyncio
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 from dataclasses import dataclass, field
-import threading
 import time
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+try:
+    import inotify_simple  # optional; Linux only
+except ImportError:
+    inotify_simple = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Filesystem events for config files within this many seconds trigger one reload
+RELOAD_DEBOUNCE = 0.1
+
+# File suffixes whose changes trigger a reload
+_CONFIG_SUFFIXES = ('.yaml', '.yml', '.json')
+
+# Environment variables with this prefix override configuration values
+_ENV_PREFIX = "LILITHOS_"
+_ENV_PREFIX_LEN = len(_ENV_PREFIX)
+
+# Environment values (stripped) matching these are converted to int / float;
+# together they accept the same strings as int() / float()
+_DIGITS = r'\d(?:_?\d)*'
+_INT_RE = re.compile(rf'[+-]?{_DIGITS}')
+_FLOAT_RE = re.compile(
+    rf'[+-]?(?:(?:{_DIGITS}\.?(?:{_DIGITS})?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?|inf(?:inity)?|nan)',
+    re.IGNORECASE
+)
+
 @dataclass
 class ConfigSection:
     """Configuration section container"""
@@ -59,25 +90,78 @@ class ConfigValidator:
         return None
 
 class ConfigWatcher(FileSystemEventHandler):
-    """File system watcher for configuration changes"""
+    """File system watcher for configuration changes
+    
+    On Linux with inotify_simple installed, the inotify fd is read directly by
+    the event loop (no watcher thread); otherwise a watchdog Observer is used.
+    """
     
     def __init__(self, config_manager: 'ConfigManager'):
         self.config_manager = config_manager
-        self.observer = Observer()
+        self.observer = None
+        self._inotify = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None  # set by ConfigManager.load()
+        self._pending_reload: Optional[asyncio.TimerHandle] = None
+    
+    def set_loop(self, loop: asyncio.AbstractEventLoop):
+        """Deliver reloads on this event loop"""
+        if loop is self.loop:
+            return
+        if self._inotify is not None:
+            if self.loop is not None:
+                self.loop.remove_reader(self._inotify.fd)
+            loop.add_reader(self._inotify.fd, self._on_inotify_ready)
+        self.loop = loop
     
     def on_modified(self, event):
-        if not event.is_directory and event.src_path.endswith(('.yaml', '.yml', '.json')):
-            asyncio.create_task(self.config_manager.reload_config())
+        # Runs on the observer thread; hand off to the event loop
+        if self.loop is not None and not event.is_directory and event.src_path.endswith(_CONFIG_SUFFIXES):
+            self.loop.call_soon_threadsafe(self._schedule_reload)
+    
+    def _on_inotify_ready(self):
+        """Drain pending inotify events on the event loop"""
+        isdir = inotify_simple.flags.ISDIR
+        events = self._inotify.read(timeout=0)
+        if any(not event.mask & isdir and event.name.endswith(_CONFIG_SUFFIXES) for event in events):
+            self._schedule_reload()
+    
+    def _schedule_reload(self):
+        """Coalesce a burst of change events (editor write + rename) into one reload"""
+        if self._pending_reload is not None:
+            self._pending_reload.cancel()
+        self._pending_reload = self.loop.call_later(RELOAD_DEBOUNCE, self._reload)
+    
+    def _reload(self):
+        self._pending_reload = None
+        asyncio.ensure_future(self.config_manager.reload_config())
     
     def start_watching(self, path: str):
         """Start watching a directory for changes"""
-        self.observer.schedule(self, path, recursive=False)
-        self.observer.start()
+        if inotify_simple is not None and sys.platform.startswith('linux'):
+            flags = inotify_simple.flags
+            self._inotify = inotify_simple.INotify()
+            self._inotify.add_watch(path, flags.MODIFY | flags.MOVED_TO | flags.CLOSE_WRITE)
+            if self.loop is not None:
+                self.loop.add_reader(self._inotify.fd, self._on_inotify_ready)
+        else:
+            self.observer = Observer()
+            self.observer.schedule(self, path, recursive=False)
+            self.observer.start()
     
     def stop_watching(self):
         """Stop watching for changes"""
-        self.observer.stop()
-        self.observer.join()
+        if self._pending_reload is not None:
+            self._pending_reload.cancel()
+            self._pending_reload = None
+        if self._inotify is not None:
+            if self.loop is not None:
+                self.loop.remove_reader(self._inotify.fd)
+            self._inotify.close()
+            self._inotify = None
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
 
 class ConfigManager:
     """
@@ -95,12 +179,15 @@ class ConfigManager:
         self.config_path = Path(config_path)
         self.config_dir = self.config_path.parent
         self.config_data: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}  # dotted key -> value, rebuilt when config_data changes
         self.sections: Dict[str, ConfigSection] = {}
         self.defaults: Dict[str, Any] = {}
+        self._defaults_yaml: Optional[bytes] = None  # serialized defaults, built on first save
         self.validators: Dict[str, callable] = {}
         self.watcher = ConfigWatcher(self)
-        self.lock = threading.RLock()
+        self.lock: Optional[asyncio.Lock] = None  # created in load() on the running loop
         self.logger = logging.getLogger("ConfigManager")
+        self._last_loaded_sig: Optional[Tuple[int, int]] = None  # (st_mtime_ns, st_size) of last load
         
         # Initialize default configuration
         self._init_defaults()
@@ -132,7 +219,8 @@ class ConfigManager:
                 "port": 8080,
                 "ssl_enabled": False,
                 "max_connections": 100,
-                "timeout": 30
+                "timeout": 30,
+                "reuse_port": False
             },
             "storage": {
                 "data_dir": "data",
@@ -157,13 +245,18 @@ class ConfigManager:
     async def load(self) -> bool:
         """Load configuration from files"""
         try:
-            with self.lock:
+            self.watcher.set_loop(asyncio.get_running_loop())
+            if self.lock is None:
+                self.lock = asyncio.Lock()
+            async with self.lock:
                 self.logger.info(f"Loading configuration from {self.config_path}")
                 
                 # Load main configuration file
-                if self.config_path.exists():
-                    with open(self.config_path, 'r', encoding='utf-8') as f:
-                        self.config_data = yaml.safe_load(f) or {}
+                sig = self._file_signature()
+                if sig is not None:
+                    # Binary stream: libyaml decodes UTF-8 itself
+                    with open(self.config_path, 'rb') as f:
+                        self.config_data = yaml.load(f, Loader=_YamlLoader) or {}
                 else:
                     self.logger.warning(f"Configuration file {self.config_path} not found, using defaults")
                     self.config_data = {}
@@ -179,6 +272,8 @@ class ConfigManager:
                 
                 # Create sections
                 self._create_sections()
+                self._rebuild_flat()
+                self._last_loaded_sig = sig
                 
                 self.logger.info("Configuration loaded successfully")
                 return True
@@ -189,53 +284,50 @@ class ConfigManager:
     
     def _merge_with_defaults(self):
         """Merge configuration with default values"""
-        def merge_dicts(default: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
-            result = default.copy()
-            for key, value in config.items():
-                if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                    result[key] = merge_dicts(result[key], value)
+        result = copy.deepcopy(self.defaults)
+        stack = [(result, self.config_data)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
                 else:
-                    result[key] = value
-            return result
+                    dst[key] = value
         
-        self.config_data = merge_dicts(self.defaults, self.config_data)
+        self.config_data = result
     
     def _load_environment_vars(self):
         """Load configuration from environment variables"""
-        env_prefix = "LILITHOS_"
+        parse = self._parse_env_value
+        config = self.config_data
         
         for key, value in os.environ.items():
-            if key.startswith(env_prefix):
-                config_key = key[len(env_prefix):].lower()
-                keys = config_key.split('_')
-                
-                # Navigate to nested dictionary
-                current = self.config_data
-                for k in keys[:-1]:
-                    if k not in current:
-                        current[k] = {}
-                    current = current[k]
-                
-                # Set the value
-                current[keys[-1]] = self._parse_env_value(value)
+            if not key.startswith(_ENV_PREFIX):
+                continue
+            keys = key[_ENV_PREFIX_LEN:].lower().split('_')
+            
+            # Navigate to nested dictionary
+            current = config
+            for k in keys[:-1]:
+                current = current.setdefault(k, {})
+            
+            # Set the value
+            current[keys[-1]] = parse(value)
     
     def _parse_env_value(self, value: str) -> Union[str, int, float, bool]:
         """Parse environment variable value to appropriate type"""
         # Boolean values
-        if value.lower() in ('true', 'false'):
-            return value.lower() == 'true'
+        lower = value.lower()
+        if lower == 'true' or lower == 'false':
+            return lower == 'true'
         
-        # Integer values
-        try:
-            return int(value)
-        except ValueError:
-            pass
-        
-        # Float values
-        try:
-            return float(value)
-        except ValueError:
-            pass
+        # Numeric values; classified up front so plain strings never raise
+        stripped = value.strip()
+        if _INT_RE.fullmatch(stripped):
+            return int(stripped)
+        if _FLOAT_RE.fullmatch(stripped):
+            return float(stripped)
         
         # String values
         return value
@@ -276,22 +368,44 @@ class ConfigManager:
                 is_valid=True
             )
     
+    def _rebuild_flat(self):
+        """Rebuild the dotted-key index used by get()"""
+        self._flat = {}
+        self._index_subtree('', self.config_data)
+    
+    def _index_subtree(self, prefix: str, node: Dict[str, Any]):
+        """Add every string-keyed path under node to the dotted-key index"""
+        flat = self._flat
+        for k, v in node.items():
+            if not isinstance(k, str):
+                continue
+            path = prefix + k
+            flat[path] = v
+            if isinstance(v, dict):
+                self._index_subtree(path + '.', v)
+    
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        """Get (mtime_ns, size) of the config file, or None if it is missing"""
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
     async def reload_config(self) -> bool:
-        """Reload configuration from files"""
+        """Reload configuration from files if the config file changed"""
+        sig = self._file_signature()
+        if sig is not None and sig == self._last_loaded_sig:
+            return True
         return await self.load()
     
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value by key (supports dot notation)"""
-        try:
-            keys = key.split('.')
-            value = self.config_data
-            
-            for k in keys:
-                value = value[k]
-            
-            return value
-        except (KeyError, TypeError):
-            return default
+        """Get configuration value by key (supports dot notation)
+        
+        Values are served from an index built on load/set/reset; change
+        configuration through set() so the index stays current.
+        """
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any) -> bool:
         """Set configuration value by key (supports dot notation)"""
@@ -300,19 +414,32 @@ class ConfigManager:
             current = self.config_data
             
             # Navigate to the parent of the target key
+            path = ''
             for k in keys[:-1]:
+                path += k
                 if k not in current:
                     current[k] = {}
+                    self._flat[path] = current[k]
                 current = current[k]
+                path += '.'
             
             # Set the value
             current[keys[-1]] = value
             
+            # Re-index only the replaced subtree
+            prefix = key + '.'
+            for stale in [k for k in self._flat if k.startswith(prefix)]:
+                del self._flat[stale]
+            self._flat[key] = value
+            if isinstance(value, dict):
+                self._index_subtree(prefix, value)
+            
             # Update sections
             if keys[0] in self.sections:
                 self.sections[keys[0]].data = self.config_data[keys[0]]
                 self.sections[keys[0]].last_modified = time.time()
             
+            self._last_loaded_sig = None  # in-memory state no longer matches the file
             return True
         except Exception as e:
             self.logger.error(f"Failed to set configuration key '{key}': {e}")
@@ -338,8 +465,16 @@ class ConfigManager:
             # Ensure directory exists
             save_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(save_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config_data, f, default_flow_style=False, indent=2)
+            # An unmodified default config is serialized once and reused
+            if self.config_data == self.defaults:
+                if self._defaults_yaml is None:
+                    self._defaults_yaml = self._dump_yaml(self.defaults)
+                data = self._defaults_yaml
+            else:
+                data = self._dump_yaml(self.config_data)
+            
+            with open(save_path, 'wb') as f:
+                f.write(data)
             
             self.logger.info(f"Configuration saved to {save_path}")
             return True
@@ -348,6 +483,11 @@ class ConfigManager:
             self.logger.error(f"Failed to save configuration: {e}")
             return False
     
+    @staticmethod
+    def _dump_yaml(data: Dict[str, Any]) -> bytes:
+        """Serialize configuration data as UTF-8 YAML"""
+        return yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, indent=2, encoding='utf-8')
+    
     def export_json(self, path: str) -> bool:
         """Export configuration as JSON"""
         try:
@@ -365,8 +505,10 @@ class ConfigManager:
     def reset_to_defaults(self) -> bool:
         """Reset configuration to default values"""
         try:
-            self.config_data = self.defaults.copy()
+            self.config_data = copy.deepcopy(self.defaults)
             self._create_sections()
+            self._rebuild_flat()
+            self._last_loaded_sig = None  # in-memory state no longer matches the file
             return True
         except Exception as e:
             self.logger.error(f"Failed to reset configuration: {e}")
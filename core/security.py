@@ -20,7 +20,7 @@ import asyncio
 import logging
 import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import json
@@ -136,6 +136,7 @@ class AuthenticationManager:
         self.session_timeout = 3600  # 1 hour
         self.max_failed_attempts = 5
         self.lockout_duration = 1800  # 30 minutes
+        self._logout_hooks: List[Callable[[str], None]] = []
     
     def _hash_password(self, password: str, salt: Optional[str] = None) -> Tuple[str, str]:
         """Hash a password with salt"""
@@ -260,6 +261,10 @@ class AuthenticationManager:
             self.security_manager.logger.error(f"Session validation failed: {e}")
             return None
     
+    def add_logout_hook(self, hook: Callable[[str], None]):
+        """Register a callback run with the token of every session that ends (logout or expiry)"""
+        self._logout_hooks.append(hook)
+    
     def _logout(self, session_token: str):
         """Logout a user"""
         if session_token in self.sessions:
@@ -267,6 +272,12 @@ class AuthenticationManager:
             if username in self.users:
                 self.users[username].session_token = None
             del self.sessions[session_token]
+        
+        for hook in self._logout_hooks:
+            try:
+                hook(session_token)
+            except Exception as e:
+                self.security_manager.logger.error(f"Logout hook failed: {e}")
     
     def logout(self, session_token: str) -> bool:
         """Logout a user"""
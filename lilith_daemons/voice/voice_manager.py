@@ -36,16 +36,50 @@ High-level voice management interface for TTS operations and audio control.
     - v1.0.0: Initial quantum-detailed scaffold
 """
 
+import os
+import sys
+import copy
+import glob
+import json
+import shutil
+import hashlib
+import tempfile
 import yaml
 import logging
+import queue
 import threading
 import time
-from typing import Dict, List, Optional, Any
+import types
+from typing import Dict, List, Optional, Any, Mapping, Sequence
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger('VoiceManager')
 
+# Parsed config files keyed by (abspath, st_mtime_ns, st_size, st_ino)
+_CONFIG_CACHE: Dict[tuple, Dict] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Resolved espeak binary ('' when not installed), looked up once per process
+_ESPEAK_PATH: Optional[str] = None
+
+# Mode for config cache sidecars: what open() would give a new file under the umask
+_umask = os.umask(0)
+os.umask(_umask)
+_SIDECAR_MODE = 0o666 & ~_umask
+del _umask
+
+# dataclass(slots=True) needs Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Deletion table for characters stripped from TTS input
+_SANITIZE_TABLE = str.maketrans('', '', '<>"\'')
+
 class TTSBackend(Enum):
     """TTS backend types."""
     PYTTSX3 = "pyttsx3"
@@ -54,7 +88,7 @@ class TTSBackend(Enum):
     AZURE = "azure"
     GOOGLE = "google"
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class VoiceProfile:
     """Voice profile configuration."""
     name: str
@@ -65,27 +99,48 @@ class VoiceProfile:
     backend: TTSBackend
 
 class VoiceManager:
+    # Backend -> initializer method name
+    _BACKEND_DISPATCH = {
+        TTSBackend.PYTTSX3: 'initialize_pyttsx3',
+        TTSBackend.GTTS: 'initialize_gtts',
+        TTSBackend.ESPEAK: 'initialize_espeak',
+    }
+    
     def __init__(self, config_file: str = "voice_config.yaml"):
         """Initialize voice manager with configuration."""
         self.config = self.load_config(config_file)
+        self._max_text_length = int(self.config.get('performance', {}).get('max_text_length', 500))
         self.tts_engine = None
-        self.voice_profiles: Dict[str, VoiceProfile] = {}
+        self.voice_profiles: Mapping[str, VoiceProfile] = types.MappingProxyType({})
         self.current_profile = "default"
-        self.audio_devices = []
+        self.audio_devices: Sequence[Mapping] = ()
         self.is_initialized = False
+        self._engine_attempted = False
+        self._devices_scanned = False
+        self._resolved_voice_id: Optional[str] = None
+        self._last_profile_name: Optional[str] = None
+        self._speak_queue: "queue.Queue" = queue.Queue()
+        self._speak_thread: Optional[threading.Thread] = None
+        self._speak_worker_lock = threading.Lock()
         
-        # Initialize components
+        # Initialize components; TTS engine and audio devices load on first use
         self.initialize_voice_profiles()
-        self.initialize_tts_engine()
-        self.scan_audio_devices()
         
     def load_config(self, config_file: str) -> Dict:
         """Load configuration from YAML file."""
         try:
-            with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+            st = os.stat(config_file)
+            key = (os.path.abspath(config_file), st.st_mtime_ns, st.st_size, st.st_ino)
+            with _CONFIG_CACHE_LOCK:
+                cached = _CONFIG_CACHE.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            
+            config = self._parse_config_file(config_file)
+            with _CONFIG_CACHE_LOCK:
+                _CONFIG_CACHE[key] = config
             logger.info(f"[VoiceManager] Configuration loaded from {config_file}")
-            return config
+            return copy.deepcopy(config)
         except FileNotFoundError:
             logger.warning(f"[VoiceManager] Config file {config_file} not found, using defaults")
             return self.get_default_config()
@@ -93,6 +148,43 @@ class VoiceManager:
             logger.error(f"[VoiceManager] Failed to load config: {e}")
             return self.get_default_config()
     
+    def _parse_config_file(self, config_file: str) -> Dict:
+        """Parse the YAML config, reusing a JSON sidecar keyed by the file's content hash."""
+        with open(config_file, 'rb') as f:
+            raw = f.read()
+        
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        cache_file = f"{config_file}.{digest}.json"
+        try:
+            with open(cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+        
+        config = yaml.load(raw, Loader=_YamlLoader)
+        
+        # Only persist configs that survive a JSON round trip unchanged
+        try:
+            encoded = json.dumps(config)
+            if json.loads(encoded) != config:
+                return config
+            for stale in glob.glob(glob.escape(config_file) + '.*.json'):
+                os.unlink(stale)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(config_file)),
+                                            suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(encoded)
+                os.chmod(tmp_path, _SIDECAR_MODE)  # mkstemp creates files 0600
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"[VoiceManager] Config cache not written: {e}")
+        
+        return config
+    
     def get_default_config(self) -> Dict:
         """Get default configuration."""
         return {
@@ -120,8 +212,10 @@ class VoiceManager:
         logger.info("[VoiceManager] Initializing voice profiles")
         
         profiles_config = self.config.get('voice_customization', {}).get('profiles', {})
+        profiles: Dict[str, VoiceProfile] = {}
         
         for profile_name, profile_config in profiles_config.items():
+            profile_name = sys.intern(str(profile_name))
             profile = VoiceProfile(
                 name=profile_name,
                 voice_id=profile_config.get('voice_id', 'en-US'),
@@ -130,7 +224,10 @@ class VoiceManager:
                 pitch=profile_config.get('pitch', 1.0),
                 backend=TTSBackend.PYTTSX3  # Default backend
             )
-            self.voice_profiles[profile_name] = profile
+            profiles[profile_name] = profile
+        
+        # Read-only view; profiles are fixed after initialization
+        self.voice_profiles = types.MappingProxyType(profiles)
         
         logger.info(f"[VoiceManager] Initialized {len(self.voice_profiles)} voice profiles")
     
@@ -142,15 +239,12 @@ class VoiceManager:
         engine_type = tts_config.get('type', 'pyttsx3')
         
         try:
-            if engine_type == 'pyttsx3':
-                self.initialize_pyttsx3(tts_config)
-            elif engine_type == 'gTTS':
-                self.initialize_gtts(tts_config)
-            elif engine_type == 'espeak':
-                self.initialize_espeak(tts_config)
-            else:
+            try:
+                initializer = self._BACKEND_DISPATCH[TTSBackend(engine_type)]
+            except (ValueError, KeyError):
                 logger.warning(f"[VoiceManager] Unknown TTS engine type: {engine_type}")
-                self.initialize_pyttsx3(tts_config)
+                initializer = self._BACKEND_DISPATCH[TTSBackend.PYTTSX3]
+            getattr(self, initializer)(tts_config)
                 
             self.is_initialized = True
             logger.info(f"[VoiceManager] TTS engine initialized: {engine_type}")
@@ -169,12 +263,17 @@ class VoiceManager:
             self.tts_engine.setProperty('rate', config.get('rate', 150))
             self.tts_engine.setProperty('volume', config.get('volume', 0.8))
             
-            # Set voice
-            voices = self.tts_engine.getProperty('voices')
-            for voice in voices:
-                if config.get('default_voice', 'en-US') in voice.id:
-                    self.tts_engine.setProperty('voice', voice.id)
-                    break
+            # Set voice: exact id match first, then first id containing the target
+            if self._resolved_voice_id is None:
+                target = config.get('default_voice', 'en-US')
+                voice_index = {voice.id: voice for voice in self.tts_engine.getProperty('voices')}
+                if target in voice_index:
+                    self._resolved_voice_id = target
+                else:
+                    self._resolved_voice_id = next(
+                        (voice_id for voice_id in voice_index if target in voice_id), '')
+            if self._resolved_voice_id:
+                self.tts_engine.setProperty('voice', self._resolved_voice_id)
                     
         except ImportError:
             logger.error("[VoiceManager] pyttsx3 not installed")
@@ -192,11 +291,13 @@ class VoiceManager:
     
     def initialize_espeak(self, config: Dict):
         """Initialize espeak TTS engine."""
+        global _ESPEAK_PATH
         try:
-            import subprocess
+            if _ESPEAK_PATH is None:
+                _ESPEAK_PATH = shutil.which('espeak') or ''
             self.espeak_config = config
-            self.espeak_available = subprocess.run(['which', 'espeak'], 
-                                                 capture_output=True).returncode == 0
+            self._espeak_bin = _ESPEAK_PATH
+            self.espeak_available = bool(_ESPEAK_PATH)
             if not self.espeak_available:
                 logger.error("[VoiceManager] espeak not found in system")
                 raise RuntimeError("espeak not available")
@@ -204,6 +305,19 @@ class VoiceManager:
             logger.error(f"[VoiceManager] espeak initialization failed: {e}")
             raise
     
+    def _ensure_engine(self) -> bool:
+        """Initialize the TTS engine on first use."""
+        if not self._engine_attempted:
+            self._engine_attempted = True
+            self.initialize_tts_engine()
+        return self.is_initialized
+    
+    def _ensure_devices(self):
+        """Scan audio devices on first use."""
+        if not self._devices_scanned:
+            self._devices_scanned = True
+            self.scan_audio_devices()
+    
     def scan_audio_devices(self):
         """Scan available audio output devices."""
         logger.info("[VoiceManager] Scanning audio devices")
@@ -212,17 +326,20 @@ class VoiceManager:
             import pyaudio
             p = pyaudio.PyAudio()
             
-            for i in range(p.get_device_count()):
-                device_info = p.get_device_info_by_index(i)
-                if device_info['maxOutputChannels'] > 0:
-                    self.audio_devices.append({
-                        'index': i,
-                        'name': device_info['name'],
-                        'channels': device_info['maxOutputChannels'],
-                        'sample_rate': device_info['defaultSampleRate']
+            try:
+                # One pass over every host API's devices; cached by _ensure_devices
+                device_infos = [p.get_device_info_by_index(i) for i in range(p.get_device_count())]
+                self.audio_devices = tuple(
+                    types.MappingProxyType({
+                        'index': info['index'],
+                        'name': info['name'],
+                        'channels': info['maxOutputChannels'],
+                        'sample_rate': info['defaultSampleRate']
                     })
-            
-            p.terminate()
+                    for info in device_infos if info['maxOutputChannels'] > 0
+                )
+            finally:
+                p.terminate()
             logger.info(f"[VoiceManager] Found {len(self.audio_devices)} audio devices")
             
         except ImportError:
@@ -232,7 +349,7 @@ class VoiceManager:
     
     def speak(self, text: str, profile: str = None, blocking: bool = True) -> bool:
         """Speak text using specified voice profile."""
-        if not self.is_initialized:
+        if not self._ensure_engine():
             logger.error("[VoiceManager] TTS engine not initialized")
             return False
         
@@ -242,7 +359,7 @@ class VoiceManager:
             return False
         
         # Get voice profile
-        profile_name = profile or self.current_profile
+        profile_name = sys.intern(profile) if profile else self.current_profile
         voice_profile = self.voice_profiles.get(profile_name)
         
         if not voice_profile:
@@ -251,18 +368,12 @@ class VoiceManager:
         
         try:
             if self.tts_engine and hasattr(self.tts_engine, 'say'):
-                # Use pyttsx3
-                self.tts_engine.setProperty('rate', voice_profile.rate)
-                self.tts_engine.setProperty('volume', voice_profile.volume)
-                self.tts_engine.say(sanitized_text)
-                
-                if blocking:
-                    self.tts_engine.runAndWait()
-                else:
-                    # Run in separate thread
-                    thread = threading.Thread(target=self.tts_engine.runAndWait)
-                    thread.daemon = True
-                    thread.start()
+                # Use pyttsx3 via the speech worker so engine access is serialized
+                self._ensure_speak_worker()
+                done = threading.Event() if blocking else None
+                self._speak_queue.put((sanitized_text, profile_name, voice_profile, done))
+                if done:
+                    done.wait()
                 
                 logger.info(f"[VoiceManager] Spoke text using profile {profile_name}")
                 return True
@@ -281,29 +392,59 @@ class VoiceManager:
         
         return False
     
+    def _ensure_speak_worker(self):
+        """Start the pyttsx3 speech worker thread if it is not running."""
+        with self._speak_worker_lock:
+            if self._speak_thread is None or not self._speak_thread.is_alive():
+                self._speak_thread = threading.Thread(target=self._speak_worker, daemon=True)
+                self._speak_thread.start()
+    
+    def _speak_worker(self):
+        """Consume queued utterances and speak them on the pyttsx3 engine."""
+        while True:
+            item = self._speak_queue.get()
+            if item is None:
+                self._speak_queue.task_done()
+                return
+            
+            text, profile_name, voice_profile, done = item
+            try:
+                # Only push properties when the profile changes
+                if profile_name != self._last_profile_name:
+                    self.tts_engine.setProperty('rate', voice_profile.rate)
+                    self.tts_engine.setProperty('volume', voice_profile.volume)
+                    self._last_profile_name = profile_name
+                self.tts_engine.say(text)
+                self.tts_engine.runAndWait()
+            except Exception as e:
+                logger.error(f"[VoiceManager] Speech synthesis failed: {e}")
+            finally:
+                if done:
+                    done.set()
+                self._speak_queue.task_done()
+    
     def speak_gtts(self, text: str, profile: VoiceProfile, blocking: bool) -> bool:
         """Speak text using gTTS."""
         try:
-            import tempfile
-            import os
+            import io
             import subprocess
             
-            # Create temporary file for audio
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                temp_filename = temp_file.name
-            
-            # Generate speech
+            # Generate speech into memory
+            audio = io.BytesIO()
             tts = self.gtts_engine(text=text, lang=profile.voice_id)
-            tts.save(temp_filename)
+            tts.write_to_fp(audio)
             
-            # Play audio
+            # Play audio by piping the MP3 to mpg123's stdin
+            player = subprocess.Popen(['mpg123', '-q', '-'], stdin=subprocess.PIPE)
             if blocking:
-                subprocess.run(['mpg123', temp_filename], check=True)
+                player.communicate(audio.getvalue())
+                if player.returncode:
+                    raise subprocess.CalledProcessError(player.returncode, player.args)
             else:
-                subprocess.Popen(['mpg123', temp_filename])
+                # Feed the pipe off-thread; communicate() also reaps the child
+                threading.Thread(target=player.communicate, args=(audio.getvalue(),),
+                                 daemon=True).start()
             
-            # Clean up
-            os.unlink(temp_filename)
             return True
             
         except Exception as e:
@@ -316,7 +457,7 @@ class VoiceManager:
             import subprocess
             
             cmd = [
-                'espeak',
+                getattr(self, '_espeak_bin', None) or 'espeak',
                 '-s', str(profile.rate),
                 '-v', profile.voice_id,
                 '-a', str(int(profile.volume * 200)),
@@ -336,19 +477,16 @@ class VoiceManager:
     
     def sanitize_text(self, text: str) -> str:
         """Sanitize text input for TTS."""
-        if not text or not isinstance(text, str):
+        if not text or not isinstance(text, str) or text.isspace():
             return ""
         
-        # Remove potentially dangerous characters
-        import re
-        sanitized = re.sub(r'[<>"\']', '', text)
-        
-        # Limit length
-        max_length = self.config.get('performance', {}).get('max_text_length', 500)
-        if len(sanitized) > max_length:
-            sanitized = sanitized[:max_length] + "..."
+        # Limit length before sanitizing so oversized input is scanned only once
+        max_length = self._max_text_length
+        if len(text) > max_length:
+            text = text[:max_length] + "..."
         
-        return sanitized.strip()
+        # Remove potentially dangerous characters
+        return text.translate(_SANITIZE_TABLE).strip()
     
     def set_voice_profile(self, profile_name: str) -> bool:
         """Set active voice profile."""
@@ -364,9 +502,10 @@ class VoiceManager:
         """Get list of available voice profiles."""
         return list(self.voice_profiles.keys())
     
-    def get_audio_devices(self) -> List[Dict]:
-        """Get list of available audio devices."""
-        return self.audio_devices.copy()
+    def get_audio_devices(self) -> Sequence[Mapping]:
+        """Get available audio devices as read-only entries (no copy is made)."""
+        self._ensure_devices()
+        return self.audio_devices
     
     def test_voice(self, text: str = "Hello, this is a test of the LilithOS voice system") -> bool:
         """Test voice synthesis with sample text."""
@@ -377,6 +516,10 @@ class VoiceManager:
         """Shutdown voice manager and cleanup resources."""
         logger.info("[VoiceManager] Shutting down voice manager")
         
+        if self._speak_thread and self._speak_thread.is_alive():
+            self._speak_queue.put(None)
+            self._speak_thread.join(timeout=5)
+        
         if self.tts_engine and hasattr(self.tts_engine, 'stop'):
             self.tts_engine.stop()
         
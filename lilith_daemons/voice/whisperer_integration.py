@@ -36,18 +36,90 @@ Integration module for event whisperer system and voice event routing.
 """
 
 import asyncio
+import itertools
 import json
 import logging
+import os
+import random
 import threading
 import time
-import websockets
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Callable, Any
 from dataclasses import dataclass
 from enum import Enum
-from queue import Queue, PriorityQueue
+
+try:
+    import orjson
+    
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+def _decode_event_dict(message):
+    """Decode an incoming whisperer event via a plain dict; ValueError if malformed."""
+    event = _json_loads(message)
+    if not isinstance(event, dict):
+        raise ValueError("event is not a JSON object")
+    data = event.get('data')
+    return (event.get('type'), {} if data is None else data,
+            event.get('priority', 2), event.get('source', 'unknown'))
+
+try:
+    import msgspec
+    
+    class _WireEvent(msgspec.Struct, gc=False):
+        """Incoming whisperer event, decoded straight from JSON."""
+        type: Optional[str] = None
+        data: Optional[dict] = None
+        priority: int = 2
+        source: str = 'unknown'
+    
+    _wire_event_decoder = msgspec.json.Decoder(_WireEvent)
+    
+    def _decode_wire_event(message):
+        try:
+            event = _wire_event_decoder.decode(message)
+        except msgspec.ValidationError:
+            # Valid JSON the fast schema does not cover; take the lenient dict path
+            return _decode_event_dict(message)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+        return event.type, {} if event.data is None else event.data, event.priority, event.source
+except ImportError:
+    _decode_wire_event = _decode_event_dict
 
 logger = logging.getLogger('WhispererIntegration')
 
+# websockets is loaded on first connect via _websockets()
+websockets = None
+
+def _websockets():
+    """Import websockets on first use."""
+    global websockets
+    if websockets is None:
+        import websockets as websockets_module
+        websockets = websockets_module
+    return websockets
+
+def blocking(handler: Callable) -> Callable:
+    """Mark an event handler as blocking so it runs off the event loop."""
+    handler._blocking = True
+    return handler
+
+# Outgoing event batching limits. With whisperer.batch_events enabled (only for
+# whisperers that decode them), several queued events are sent as one
+# {"type": "batch", "events": [...]} frame
+SEND_BATCH_MAX_EVENTS = 64
+SEND_BATCH_MAX_BYTES = 16 * 1024
+
+# Reconnect backoff: base * 2**retries seconds, capped, with +/-50% jitter
+RECONNECT_BASE_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
 class EventPriority(Enum):
     """Event priority levels."""
     LOW = 3
@@ -55,26 +127,84 @@ class EventPriority(Enum):
     HIGH = 1
     CRITICAL = 0
 
+# Queue priority of the stop() sentinel; sorts after every event so queued
+# events are still handled before the processor exits
+_STOP_PRIORITY = max(p.value for p in EventPriority) + 1
+
+# Upper bound on recycled WhispererEvent objects kept for reuse
+EVENT_POOL_MAX = 64
+
 @dataclass
 class WhispererEvent:
     """Whisperer event structure."""
+    __slots__ = ('event_type', 'data', 'priority', 'timestamp_ns', 'source')
+    
     event_type: str
     data: Dict[str, Any]
     priority: EventPriority
-    timestamp: float
+    timestamp_ns: int  # time.monotonic_ns() at receipt
     source: str
 
 class WhispererIntegration:
+    # Built-in routes: event type -> VoiceEvent member name
+    _SIGNAL_MAP = {
+        'system_startup': 'SYSTEM_STARTUP',
+        'system_shutdown': 'SYSTEM_SHUTDOWN',
+        'error_detected': 'ERROR_OCCURRED',
+        'success_completed': 'SUCCESS_COMPLETED',
+        'security_alert': 'SECURITY_ALERT',
+    }
+    
+    # Built-in routes: event type -> phrase script trigger
+    _PHRASE_MAP = {
+        'network_connected': 'network_connected',
+        'mesh_peer_discovered': 'mesh_peer_discovered',
+        'memory_scan_complete': 'memory_scan_complete',
+        'memory_anomaly': 'memory_anomaly',
+        'bootloader_mode': 'bootloader_mode',
+        'psp_mode': 'psp_mode',
+        'vita_mode': 'vita_mode',
+        'theme_change': 'divine_black_theme',
+        'user_interaction': 'user_interaction',
+        'ota_update_available': 'ota_update',
+        'whispurrnet_ready': 'whisperer_ready',
+        'encryption_active': 'encryption_active',
+    }
+    
+    # Built-in routes: event type -> (fixed text, speech priority)
+    _SPEAK_MAP = {
+        'network_disconnected': ("Network connection lost", 2),
+        'memory_scan_start': ("Memory scan initiated", 1),
+        'animation_trigger': ("Animation triggered", 1),
+        'ota_update_complete': ("Update completed successfully", 1),
+        'secure_channel_established': ("Secure communication channel established", 1),
+    }
+    
     def __init__(self, voice_daemon, config: Dict = None):
         """Initialize whisperer integration."""
         self.voice_daemon = voice_daemon
         self.config = config or {}
         self.running = False
         self.websocket = None
-        self.event_queue = PriorityQueue()
+        self.event_queue: Optional[asyncio.PriorityQueue] = None  # created on first event or in start()
+        self._event_seq = itertools.count()  # tie-breaker so events are never compared
+        self._event_pool: List[WhispererEvent] = []
         self.event_handlers: Dict[str, Callable] = {}
+        self._registration_payload: Optional[str] = None  # serialized on first connect
         self.connection_retries = 0
-        self.max_retries = self.config.get('max_retries', 5)
+        self.max_retries = self.config.get('max_retries')  # None: keep reconnecting forever
+        
+        # Outgoing (payload, result future) pairs, drained in batches by _send_writer;
+        # created in start() only when batching is enabled
+        self.batch_events = self.config.get('whisperer', {}).get('batch_events', False)
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        
+        # Set by stop() to cut a reconnect backoff short (created in start())
+        self._reconnect_wake: Optional[asyncio.Event] = None
+        
+        # Dedicated pool for handlers marked @blocking (created on first use)
+        self._blocking_pool: Optional[ThreadPoolExecutor] = None
         
         # Event mappings from config
         self.event_mappings = self.config.get('event_mappings', {})
@@ -86,48 +216,40 @@ class WhispererIntegration:
         """Initialize default event handlers."""
         logger.info("[WhispererIntegration] Initializing event handlers")
         
-        # System events
-        self.register_event_handler('system_startup', self.handle_system_startup)
-        self.register_event_handler('system_shutdown', self.handle_system_shutdown)
-        self.register_event_handler('error_detected', self.handle_error_detected)
-        self.register_event_handler('success_completed', self.handle_success_completed)
-        self.register_event_handler('security_alert', self.handle_security_alert)
-        
-        # Network events
-        self.register_event_handler('network_connected', self.handle_network_connected)
-        self.register_event_handler('network_disconnected', self.handle_network_disconnected)
-        self.register_event_handler('mesh_peer_discovered', self.handle_mesh_peer_discovered)
-        
-        # Memory scanner events
-        self.register_event_handler('memory_scan_start', self.handle_memory_scan_start)
-        self.register_event_handler('memory_scan_complete', self.handle_memory_scan_complete)
-        self.register_event_handler('memory_anomaly', self.handle_memory_anomaly)
-        
-        # Bootloader events
-        self.register_event_handler('bootloader_mode', self.handle_bootloader_mode)
-        self.register_event_handler('psp_mode', self.handle_psp_mode)
-        self.register_event_handler('vita_mode', self.handle_vita_mode)
-        
-        # LiveArea events
-        self.register_event_handler('theme_change', self.handle_theme_change)
-        self.register_event_handler('animation_trigger', self.handle_animation_trigger)
-        self.register_event_handler('user_interaction', self.handle_user_interaction)
-        
-        # OTA events
-        self.register_event_handler('ota_update_available', self.handle_ota_update_available)
+        # Most built-in events are routed through the class-level tables in
+        # handle_event; only events that need custom logic get a handler
         self.register_event_handler('ota_update_progress', self.handle_ota_update_progress)
-        self.register_event_handler('ota_update_complete', self.handle_ota_update_complete)
         
-        # WhispurrNet events
-        self.register_event_handler('whispurrnet_ready', self.handle_whispurrnet_ready)
-        self.register_event_handler('encryption_active', self.handle_encryption_active)
-        self.register_event_handler('secure_channel_established', self.handle_secure_channel_established)
+        # Resolve the voice daemon entry points once so dispatch does no lookups
+        self._speak_text = self.voice_daemon.speak_text
+        self._process_phrase_script = self.voice_daemon.process_phrase_script
+        signal_to_speech = self.voice_daemon.signal_to_speech_map
+        voice_event = getattr(self.voice_daemon, 'VoiceEvent', None)
+        if voice_event is None:
+            logger.warning("[WhispererIntegration] Voice daemon has no VoiceEvent; signal events disabled")
+            self._signal_routes = {}
+        else:
+            self._signal_routes = {
+                event_type: (signal_to_speech, getattr(voice_event, member))
+                for event_type, member in self._SIGNAL_MAP.items()
+            }
         
-        logger.info(f"[WhispererIntegration] Registered {len(self.event_handlers)} event handlers")
+        logger.info(f"[WhispererIntegration] Registered {len(self.event_types)} event handlers")
+    
+    @property
+    def event_types(self) -> List[str]:
+        """Event types this integration can handle."""
+        return list({**self._SIGNAL_MAP, **self._PHRASE_MAP, **self._SPEAK_MAP,
+                     **self.event_handlers}.keys())
     
     def register_event_handler(self, event_type: str, handler: Callable):
-        """Register event handler for specific event type."""
+        """Register event handler for specific event type.
+
+        Handlers run inline on the event loop; decorate one with @blocking if it
+        does blocking work so it runs on a worker thread instead.
+        """
         self.event_handlers[event_type] = handler
+        self._registration_payload = None  # event types changed; re-serialize on connect
         logger.debug(f"[WhispererIntegration] Registered handler for event: {event_type}")
     
     async def connect_to_whisperer(self):
@@ -142,21 +264,22 @@ class WhispererIntegration:
         try:
             logger.info(f"[WhispererIntegration] Connecting to whisperer at {url}")
             self.websocket = await asyncio.wait_for(
-                websockets.connect(url),
+                _websockets().connect(url),
                 timeout=timeout
             )
             
-            # Send registration message
-            registration = {
-                'type': 'register',
-                'component': 'lilith_voice',
-                'capabilities': ['tts', 'audio_output', 'phrase_scripting'],
-                'event_types': list(self.event_handlers.keys())
-            }
+            # Send registration message, reusing the serialized form across reconnects
+            if self._registration_payload is None:
+                self._registration_payload = _json_dumps({
+                    'type': 'register',
+                    'component': 'lilith_voice',
+                    'capabilities': ['tts', 'audio_output', 'phrase_scripting'],
+                    'event_types': self.event_types
+                })
             
-            await self.websocket.send(json.dumps(registration))
+            await self.websocket.send(self._registration_payload)
             response = await self.websocket.recv()
-            response_data = json.loads(response)
+            response_data = _json_loads(response)
             
             if response_data.get('status') == 'registered':
                 logger.info("[WhispererIntegration] Successfully registered with whisperer")
@@ -164,6 +287,7 @@ class WhispererIntegration:
                 return True
             else:
                 logger.error(f"[WhispererIntegration] Registration failed: {response_data}")
+                self.connection_retries += 1
                 return False
                 
         except Exception as e:
@@ -179,83 +303,151 @@ class WhispererIntegration:
             try:
                 if not self.websocket:
                     if not await self.connect_to_whisperer():
-                        await asyncio.sleep(5)  # Wait before retry
+                        if not await self._reconnect_backoff():
+                            break
                         continue
                 
                 # Listen for events
                 message = await self.websocket.recv()
-                event_data = json.loads(message)
                 
-                # Process event
-                await self.process_event(event_data)
+                # Process event; a malformed message is skipped, not a reason to reconnect
+                try:
+                    await self._dispatch_event(*_decode_wire_event(message))
+                except ValueError as e:
+                    logger.warning(f"[WhispererIntegration] Skipping malformed event: {e}")
                 
-            except websockets.exceptions.ConnectionClosed:
+            except _websockets().exceptions.ConnectionClosed:
                 logger.warning("[WhispererIntegration] Connection closed, attempting reconnect")
                 self.websocket = None
-                await asyncio.sleep(2)
+                self.connection_retries += 1
+                if not await self._reconnect_backoff():
+                    break
                 
             except Exception as e:
                 logger.error(f"[WhispererIntegration] Event processing error: {e}")
-                await asyncio.sleep(1)
+                if not await self._reconnect_backoff():
+                    break
         
         logger.info("[WhispererIntegration] Event listener stopped")
     
+    async def _reconnect_backoff(self) -> bool:
+        """Wait before reconnecting; False once a configured max_retries is reached.
+        
+        Giving up only stops the listener; locally dispatched events are
+        still handled by the processor worker.
+        """
+        if self.max_retries is not None and self.connection_retries >= self.max_retries:
+            logger.critical(f"[WhispererIntegration] Giving up after {self.connection_retries} failed connection attempts")
+            return False
+        
+        delay = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** min(self.connection_retries, 16))
+        delay *= random.uniform(0.5, 1.5)
+        try:
+            await asyncio.wait_for(self._reconnect_wake.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        return True
+    
     async def process_event(self, event_data: Dict):
         """Process incoming event from whisperer."""
-        event_type = event_data.get('type')
-        data = event_data.get('data', {})
-        priority = EventPriority(event_data.get('priority', 2))
-        source = event_data.get('source', 'unknown')
+        await self._dispatch_event(
+            event_data.get('type'),
+            event_data.get('data', {}),
+            event_data.get('priority', 2),
+            event_data.get('source', 'unknown')
+        )
+    
+    async def _dispatch_event(self, event_type: str, data: Dict[str, Any], priority_value: int, source: str):
+        """Route a decoded event to the handler or the priority queue."""
+        priority = EventPriority(priority_value)
         
-        logger.info(f"[WhispererIntegration] Processing event: {event_type} from {source}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[WhispererIntegration] Processing event: %s from %s", event_type, source)
         
         # Create whisperer event
-        whisperer_event = WhispererEvent(
-            event_type=event_type,
-            data=data,
-            priority=priority,
-            timestamp=time.time(),
-            source=source
-        )
+        whisperer_event = self._acquire_event(event_type, data, priority, time.monotonic_ns(), source)
         
-        # Add to priority queue
-        self.event_queue.put((priority.value, whisperer_event))
-        
-        # Process immediately if high priority
-        if priority in [EventPriority.HIGH, EventPriority.CRITICAL]:
+        # High priority events are handled right away; the rest go through the queue
+        if priority is EventPriority.HIGH or priority is EventPriority.CRITICAL:
             await self.handle_event(whisperer_event)
+            self._release_event(whisperer_event)
+        else:
+            if self.event_queue is None:
+                # Event arrived before start(); queue it for the processor to pick up
+                self.event_queue = asyncio.PriorityQueue()
+            await self.event_queue.put((priority.value, next(self._event_seq), whisperer_event))
+    
+    def _acquire_event(self, event_type: str, data: Dict[str, Any], priority: EventPriority,
+                       timestamp_ns: int, source: str) -> WhispererEvent:
+        """Take an event from the pool (or allocate one) and fill it in."""
+        if not self._event_pool:
+            return WhispererEvent(event_type, data, priority, timestamp_ns, source)
+        
+        event = self._event_pool.pop()
+        event.event_type = event_type
+        event.data = data
+        event.priority = priority
+        event.timestamp_ns = timestamp_ns
+        event.source = source
+        return event
+    
+    def _release_event(self, event: WhispererEvent):
+        """Return a fully handled event to the pool; extras are dropped."""
+        if len(self._event_pool) < EVENT_POOL_MAX:
+            event.data = None
+            self._event_pool.append(event)
     
     async def handle_event(self, event: WhispererEvent):
         """Handle specific event."""
-        handler = self.event_handlers.get(event.event_type)
+        event_type = event.event_type
+        handler = self.event_handlers.get(event_type)
         
-        if handler:
+        if handler is None:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[WhispererIntegration] Handling %s", event_type)
             try:
-                # Call handler in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, handler, event)
+                if event_type in self._signal_routes:
+                    signal_to_speech, voice_event = self._signal_routes[event_type]
+                    signal_to_speech(voice_event, event.data)
+                elif event_type in self._PHRASE_MAP:
+                    self._process_phrase_script(self._PHRASE_MAP[event_type], event.data)
+                elif event_type in self._SPEAK_MAP:
+                    text, priority = self._SPEAK_MAP[event_type]
+                    self._speak_text(text, priority=priority)
+                else:
+                    logger.warning(f"[WhispererIntegration] No handler for event: {event_type}")
             except Exception as e:
-                logger.error(f"[WhispererIntegration] Event handler error for {event.event_type}: {e}")
+                logger.error(f"[WhispererIntegration] Event handler error for {event_type}: {e}")
         else:
-            logger.warning(f"[WhispererIntegration] No handler for event: {event.event_type}")
+            try:
+                # Handlers only queue speech, so run them inline; blocking ones go to the pool
+                if getattr(handler, '_blocking', False):
+                    if self._blocking_pool is None:
+                        # Leave a core for the event loop
+                        pool_size = min(2, max(1, (os.cpu_count() or 1) - 1))
+                        self._blocking_pool = ThreadPoolExecutor(max_workers=pool_size)
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(self._blocking_pool, handler, event)
+                else:
+                    handler(event)
+            except Exception as e:
+                logger.error(f"[WhispererIntegration] Event handler error for {event_type}: {e}")
     
     async def event_processor_worker(self):
         """Worker to process events from queue."""
         logger.info("[WhispererIntegration] Starting event processor worker")
         
-        while self.running:
+        while True:
             try:
-                # Get event from queue with timeout
-                try:
-                    priority, event = self.event_queue.get(timeout=1)
-                    await self.handle_event(event)
-                    self.event_queue.task_done()
-                except asyncio.TimeoutError:
-                    continue
+                # Sleep on the queue until an event arrives
+                _, _, event = await self.event_queue.get()
+                if event is None:  # stop() sentinel, queued behind all events
+                    break
+                await self.handle_event(event)
+                self._release_event(event)
                     
             except Exception as e:
                 logger.error(f"[WhispererIntegration] Event processor error: {e}")
-                await asyncio.sleep(0.1)
         
         logger.info("[WhispererIntegration] Event processor worker stopped")
     
@@ -274,151 +466,82 @@ class WhispererIntegration:
                 'timestamp': time.time()
             }
             
-            await self.websocket.send(json.dumps(event_message))
-            logger.debug(f"[WhispererIntegration] Sent event: {event_type}")
-            return True
+            payload = _json_dumps(event_message)
+            if self._send_queue is None:
+                await self.websocket.send(payload)
+                logger.debug(f"[WhispererIntegration] Sent event: {event_type}")
+                return True
+            
+            # Batched: wait for the writer to report how the batch went
+            sent = asyncio.get_running_loop().create_future()
+            self._send_queue.put_nowait((payload, sent))
+            return await sent
             
         except Exception as e:
             logger.error(f"[WhispererIntegration] Failed to send event: {e}")
             return False
     
-    # Event handler implementations
-    def handle_system_startup(self, event: WhispererEvent):
-        """Handle system startup event."""
-        logger.info("[WhispererIntegration] Handling system startup")
-        self.voice_daemon.signal_to_speech_map(
-            self.voice_daemon.VoiceEvent.SYSTEM_STARTUP,
-            event.data
-        )
-    
-    def handle_system_shutdown(self, event: WhispererEvent):
-        """Handle system shutdown event."""
-        logger.info("[WhispererIntegration] Handling system shutdown")
-        self.voice_daemon.signal_to_speech_map(
-            self.voice_daemon.VoiceEvent.SYSTEM_SHUTDOWN,
-            event.data
-        )
-    
-    def handle_error_detected(self, event: WhispererEvent):
-        """Handle error detected event."""
-        logger.info("[WhispererIntegration] Handling error detected")
-        self.voice_daemon.signal_to_speech_map(
-            self.voice_daemon.VoiceEvent.ERROR_OCCURRED,
-            event.data
-        )
-    
-    def handle_success_completed(self, event: WhispererEvent):
-        """Handle success completed event."""
-        logger.info("[WhispererIntegration] Handling success completed")
-        self.voice_daemon.signal_to_speech_map(
-            self.voice_daemon.VoiceEvent.SUCCESS_COMPLETED,
-            event.data
-        )
-    
-    def handle_security_alert(self, event: WhispererEvent):
-        """Handle security alert event."""
-        logger.info("[WhispererIntegration] Handling security alert")
-        self.voice_daemon.signal_to_speech_map(
-            self.voice_daemon.VoiceEvent.SECURITY_ALERT,
-            event.data
-        )
-    
-    def handle_network_connected(self, event: WhispererEvent):
-        """Handle network connected event."""
-        logger.info("[WhispererIntegration] Handling network connected")
-        self.voice_daemon.process_phrase_script('network_connected', event.data)
-    
-    def handle_network_disconnected(self, event: WhispererEvent):
-        """Handle network disconnected event."""
-        logger.info("[WhispererIntegration] Handling network disconnected")
-        self.voice_daemon.speak_text("Network connection lost", priority=2)
-    
-    def handle_mesh_peer_discovered(self, event: WhispererEvent):
-        """Handle mesh peer discovered event."""
-        logger.info("[WhispererIntegration] Handling mesh peer discovered")
-        self.voice_daemon.process_phrase_script('mesh_peer_discovered', event.data)
-    
-    def handle_memory_scan_start(self, event: WhispererEvent):
-        """Handle memory scan start event."""
-        logger.info("[WhispererIntegration] Handling memory scan start")
-        self.voice_daemon.speak_text("Memory scan initiated", priority=1)
-    
-    def handle_memory_scan_complete(self, event: WhispererEvent):
-        """Handle memory scan complete event."""
-        logger.info("[WhispererIntegration] Handling memory scan complete")
-        self.voice_daemon.process_phrase_script('memory_scan_complete', event.data)
-    
-    def handle_memory_anomaly(self, event: WhispererEvent):
-        """Handle memory anomaly event."""
-        logger.info("[WhispererIntegration] Handling memory anomaly")
-        self.voice_daemon.process_phrase_script('memory_anomaly', event.data)
-    
-    def handle_bootloader_mode(self, event: WhispererEvent):
-        """Handle bootloader mode event."""
-        logger.info("[WhispererIntegration] Handling bootloader mode")
-        self.voice_daemon.process_phrase_script('bootloader_mode', event.data)
-    
-    def handle_psp_mode(self, event: WhispererEvent):
-        """Handle PSP mode event."""
-        logger.info("[WhispererIntegration] Handling PSP mode")
-        self.voice_daemon.process_phrase_script('psp_mode', event.data)
-    
-    def handle_vita_mode(self, event: WhispererEvent):
-        """Handle Vita mode event."""
-        logger.info("[WhispererIntegration] Handling Vita mode")
-        self.voice_daemon.process_phrase_script('vita_mode', event.data)
-    
-    def handle_theme_change(self, event: WhispererEvent):
-        """Handle theme change event."""
-        logger.info("[WhispererIntegration] Handling theme change")
-        self.voice_daemon.process_phrase_script('divine_black_theme', event.data)
-    
-    def handle_animation_trigger(self, event: WhispererEvent):
-        """Handle animation trigger event."""
-        logger.info("[WhispererIntegration] Handling animation trigger")
-        self.voice_daemon.speak_text("Animation triggered", priority=1)
-    
-    def handle_user_interaction(self, event: WhispererEvent):
-        """Handle user interaction event."""
-        logger.info("[WhispererIntegration] Handling user interaction")
-        self.voice_daemon.process_phrase_script('user_interaction', event.data)
-    
-    def handle_ota_update_available(self, event: WhispererEvent):
-        """Handle OTA update available event."""
-        logger.info("[WhispererIntegration] Handling OTA update available")
-        self.voice_daemon.process_phrase_script('ota_update', event.data)
+    async def _send_writer(self):
+        """Drain queued outgoing events, coalescing bursts into one frame."""
+        batch = []
+        try:
+            while True:
+                batch = [await self._send_queue.get()]
+                size = len(batch[0][0])
+                while (len(batch) < SEND_BATCH_MAX_EVENTS and size < SEND_BATCH_MAX_BYTES
+                       and not self._send_queue.empty()):
+                    item = self._send_queue.get_nowait()
+                    batch.append(item)
+                    size += len(item[0])
+                
+                if len(batch) == 1:
+                    payload = batch[0][0]
+                else:
+                    payload = '{"type": "batch", "events": [' + ', '.join(item[0] for item in batch) + ']}'
+                
+                try:
+                    await self.websocket.send(payload)
+                    logger.debug(f"[WhispererIntegration] Sent {len(batch)} event(s)")
+                    ok = True
+                except Exception as e:
+                    logger.error(f"[WhispererIntegration] Failed to send {len(batch)} event(s): {e}")
+                    ok = False
+                
+                for _, sent in batch:
+                    if not sent.done():
+                        sent.set_result(ok)
+                batch = []
+        finally:
+            # Writer stopped: events still waiting will never be sent
+            while not self._send_queue.empty():
+                batch.append(self._send_queue.get_nowait())
+            for _, sent in batch:
+                if not sent.done():
+                    sent.set_result(False)
     
+    # Event handler implementations
     def handle_ota_update_progress(self, event: WhispererEvent):
         """Handle OTA update progress event."""
         logger.info("[WhispererIntegration] Handling OTA update progress")
         progress = event.data.get('progress', 0)
         self.voice_daemon.speak_text(f"Update progress: {progress} percent", priority=1)
     
-    def handle_ota_update_complete(self, event: WhispererEvent):
-        """Handle OTA update complete event."""
-        logger.info("[WhispererIntegration] Handling OTA update complete")
-        self.voice_daemon.speak_text("Update completed successfully", priority=1)
-    
-    def handle_whispurrnet_ready(self, event: WhispererEvent):
-        """Handle WhispurrNet ready event."""
-        logger.info("[WhispererIntegration] Handling WhispurrNet ready")
-        self.voice_daemon.process_phrase_script('whisperer_ready', event.data)
-    
-    def handle_encryption_active(self, event: WhispererEvent):
-        """Handle encryption active event."""
-        logger.info("[WhispererIntegration] Handling encryption active")
-        self.voice_daemon.process_phrase_script('encryption_active', event.data)
-    
-    def handle_secure_channel_established(self, event: WhispererEvent):
-        """Handle secure channel established event."""
-        logger.info("[WhispererIntegration] Handling secure channel established")
-        self.voice_daemon.speak_text("Secure communication channel established", priority=1)
-    
     async def start(self):
         """Start whisperer integration."""
         logger.info("[WhispererIntegration] Starting whisperer integration")
         self.running = True
         
+        # Queues are created here so they bind to the running loop; events
+        # dispatched before start() may already have created the event queue
+        if self.event_queue is None:
+            self.event_queue = asyncio.PriorityQueue()
+        self._reconnect_wake = asyncio.Event()
+        
+        # Start outgoing event writer when batching is enabled
+        if self.batch_events:
+            self._send_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._send_writer())
+        
         # Start event listener and processor
         listener_task = asyncio.create_task(self.listen_for_events())
         processor_task = asyncio.create_task(self.event_processor_worker())
@@ -429,16 +552,32 @@ class WhispererIntegration:
             logger.error(f"[WhispererIntegration] Integration error: {e}")
         finally:
             self.running = False
+            if self._writer_task:
+                self._writer_task.cancel()
     
     async def stop(self):
         """Stop whisperer integration."""
         logger.info("[WhispererIntegration] Stopping whisperer integration")
         self.running = False
         
+        if self._writer_task:
+            self._writer_task.cancel()
+        
+        if self._reconnect_wake:
+            self._reconnect_wake.set()
+        
+        if self.event_queue:
+            # Stop the processor worker once it has drained the queued events
+            self.event_queue.put_nowait((_STOP_PRIORITY, next(self._event_seq), None))
+        
         if self.websocket:
             await self.websocket.close()
             self.websocket = None
         
+        if self._blocking_pool:
+            self._blocking_pool.shutdown(wait=False)
+            self._blocking_pool = None
+        
         logger.info("[WhispererIntegration] Whisperer integration stopped")
 
 def create_whisperer_integration(voice_daemon, config: Dict = None) -> WhispererIntegration:
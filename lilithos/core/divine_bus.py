@@ -18,9 +18,218 @@ from cryptography.hazmat.primitives import hashes, hmac
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.exceptions import InvalidTag
 
+try:
+    from nacl.exceptions import CryptoError as _NaclCryptoError
+except ImportError:
+    _NaclCryptoError = InvalidTag  # nacl backend unavailable; nothing else raises it
+
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    
+    _loads = json.loads
+
+try:
+    import ormsgpack
+    
+    _packb = ormsgpack.packb
+    _unpackb = ormsgpack.unpackb
+except ImportError:
+    try:
+        import msgpack
+        
+        _packb = msgpack.packb
+        _unpackb = msgpack.unpackb
+    except ImportError:  # msgpack wire format unavailable
+        _packb = _unpackb = None
+
 # Configure logging
 logger = logging.getLogger("lilith.divine_bus")
 
+# Seconds a connection may sit idle between messages / mid-message
+IDLE_TIMEOUT = 30.0
+PARTIAL_MESSAGE_TIMEOUT = 5.0
+
+# Decrypted messages queued per connection before reading is paused
+MAX_QUEUED_MESSAGES = 16
+
+# Queue marker for a frame whose declared length exceeds max_message_size;
+# every other queued item is a (message, reply encoder, error) tuple
+_OVERSIZED = object()
+
+
+class _DivineBusProtocol(asyncio.BufferedProtocol):
+    """One DivineBus connection.
+    
+    Frames (4-byte big-endian length + nonce || ciphertext || tag) are received
+    into a single buffer allocated at accept time and decrypted straight out of
+    it, so no per-message read buffers are allocated. Decrypted messages are
+    handled in order by a per-connection worker task.
+    """
+    
+    def __init__(self, bus: 'DivineBus'):
+        self.bus = bus
+        self.max_size = bus.config["max_message_size"]
+        self._buf = bytearray(self.max_size + 4)
+        self._start = 0  # first unconsumed byte in _buf
+        self._end = 0  # end of received data in _buf
+        self._messages: asyncio.Queue = asyncio.Queue()
+        self._paused = False
+        self._can_write = asyncio.Event()  # cleared while the transport's write buffer is full
+        self._can_write.set()
+        self._pending = 0  # messages queued or being handled; no read timeout while > 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.transport: Optional[asyncio.Transport] = None
+        self.conn_id = bus._connection_id
+        bus._connection_id += 1
+    
+    def connection_made(self, transport: asyncio.Transport):
+        self.transport = transport
+        logger.info(f"New DivineBus connection from {transport.get_extra_info('peername')} [conn-{self.conn_id}]")
+        self._worker = self.bus._loop.create_task(self._process_messages())
+        self._arm_timeout()
+    
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return memoryview(self._buf)[self._end:]
+    
+    def buffer_updated(self, nbytes: int):
+        self._end += nbytes
+        buf = self._buf
+        
+        while self._end - self._start >= 4:
+            msg_len = struct.unpack_from('>I', buf, self._start)[0]
+            if msg_len > self.max_size:
+                logger.warning(f"Message too large: {msg_len} bytes")
+                self.transport.pause_reading()
+                self._cancel_timeout()
+                self._pending += 1
+                self._messages.put_nowait(_OVERSIZED)
+                return
+            
+            body_start = self._start + 4
+            body_end = body_start + msg_len
+            if body_end > self._end:
+                break
+            
+            self._messages.put_nowait(self._read_message(memoryview(buf)[body_start:body_end]))
+            self._pending += 1
+            self._start = body_end
+        
+        # Move a partial frame to the front so the rest of it always fits
+        if self._start:
+            remaining = self._end - self._start
+            buf[:remaining] = buf[self._start:self._end]
+            self._start, self._end = 0, remaining
+        
+        if not self._paused and self._messages.qsize() >= MAX_QUEUED_MESSAGES:
+            self._paused = True
+            self.transport.pause_reading()
+        
+        # Only time out while waiting on the peer; handlers may take longer
+        if self._pending:
+            self._cancel_timeout()
+        else:
+            self._arm_timeout()
+    
+    def _read_message(self, frame: memoryview) -> Tuple[Optional[Dict], Callable, Optional[Dict]]:
+        """Decrypt and decode one frame into (message, reply encoder, error)."""
+        bus = self.bus
+        try:
+            payload = bus._decrypt(frame)
+        except Exception as e:
+            logger.warning(f"Rejected message on connection {self.conn_id}: {e}")
+            return None, bus._dumps, {"code": "invalid_message", "message": "Message authentication failed"}
+        
+        try:
+            message, dumps = bus._decode_message(payload)
+        except Exception as e:
+            logger.warning(f"Undecodable message on connection {self.conn_id}: {e}")
+            return None, bus._dumps, {"code": "invalid_message", "message": "Message could not be decoded"}
+        
+        if not isinstance(message, dict):
+            logger.warning(f"Non-object message on connection {self.conn_id}")
+            return None, dumps, {"code": "invalid_message", "message": "Message must be an object"}
+        return message, dumps, None
+    
+    def pause_writing(self):
+        self._can_write.clear()
+    
+    def resume_writing(self):
+        self._can_write.set()
+    
+    def connection_lost(self, exc: Optional[Exception]):
+        self._cancel_timeout()
+        self._can_write.set()  # release a worker waiting to write
+        self._messages.put_nowait(None)
+        logger.info(f"Connection {self.conn_id} closed")
+    
+    def _cancel_timeout(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+    
+    def _arm_timeout(self):
+        self._cancel_timeout()
+        timeout = PARTIAL_MESSAGE_TIMEOUT if self._end else IDLE_TIMEOUT
+        self._timer = self.bus._loop.call_later(timeout, self._on_timeout)
+    
+    def _on_timeout(self):
+        logger.debug(f"Connection {self.conn_id} timed out")
+        self.transport.close()
+    
+    async def _process_messages(self):
+        """Handle decrypted messages in arrival order and write the responses."""
+        while True:
+            item = await self._messages.get()
+            if item is None or not self.bus.running:
+                break
+            
+            if self._paused and self._messages.qsize() < MAX_QUEUED_MESSAGES:
+                self._paused = False
+                self.transport.resume_reading()
+            
+            if item is _OVERSIZED:
+                error = {"code": "message_too_large", "message": "Message exceeds maximum size"}
+                self.transport.write(self.bus._encode_frame(self.bus._create_response(error=error)))
+                break
+            
+            message, dumps, error = item
+            if error is not None:
+                response = self.bus._create_response(error=error)
+            else:
+                try:
+                    result = await self.bus._handle_rpc(message)
+                    response = self.bus._create_response(result=result)
+                except Exception as e:
+                    logger.error(f"Error processing RPC: {e}", exc_info=True)
+                    response = self.bus._create_response(error={"code": "internal_error", "message": str(e)})
+            
+            # Wait out a full write buffer; reading stays paused meanwhile once
+            # MAX_QUEUED_MESSAGES requests are queued, so a peer that never
+            # reads cannot grow either buffer without bound
+            await self._can_write.wait()
+            if self.transport.is_closing():
+                break
+            try:
+                self.transport.write(self.bus._encode_frame(response, dumps))
+            except Exception as e:
+                logger.error(f"Failed to send response: {e}", exc_info=True)
+                break
+            
+            self._pending -= 1
+            if not self._pending:
+                self._arm_timeout()
+        
+        self.transport.close()
+
+
 class DivineBus:
     """Secure RPC communication bus for LilithOS <-> AthenaCore communication."""
     
@@ -33,8 +242,16 @@ class DivineBus:
         self.config_path = config_path
         self.config = self._load_config()
         self.aes_key = self._derive_key(self.config["shared_secret"].encode())
+        self._aesgcm = AESGCM(self.aes_key)  # keyed once, reused for every message
+        self._nacl = self._load_nacl_backend() if self.config.get("crypto_backend") == "nacl" else None
+        self.wire_format = self.config.get("wire_format", "json")
+        if self.wire_format == "msgpack" and _packb is None:
+            logger.warning("wire_format 'msgpack' requires ormsgpack or msgpack; using json")
+            self.wire_format = "json"
+        self._dumps = _packb if self.wire_format == "msgpack" else _dumps
         self.running = False
         self.server = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # set by start()
         self._handlers = {}
         self._default_handler = None
         self._connection_id = 0
@@ -79,8 +296,9 @@ class DivineBus:
             
         self.running = True
         try:
-            self.server = await asyncio.start_server(
-                self._handle_connection,
+            self._loop = loop = asyncio.get_running_loop()
+            self.server = await loop.create_server(
+                lambda: _DivineBusProtocol(self),
                 host=self.config["host"],
                 port=self.config["port"]
             )
@@ -119,66 +337,6 @@ class DivineBus:
         """Set the default handler for unregistered methods."""
         self._default_handler = handler
     
-    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        """Handle a new client connection."""
-        conn_id = self._connection_id
-        self._connection_id += 1
-        
-        client_addr = writer.get_extra_info('peername')
-        logger.info(f"New DivineBus connection from {client_addr} [conn-{conn_id}]")
-        
-        try:
-            while self.running:
-                # Read message length (4 bytes, big-endian)
-                try:
-                    msg_len_bytes = await asyncio.wait_for(
-                        reader.readexactly(4),
-                        timeout=30.0
-                    )
-                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
-                    logger.debug(f"Connection {conn_id} timed out or closed")
-                    break
-                    
-                msg_len = struct.unpack('>I', msg_len_bytes)[0]
-                
-                # Validate message length
-                if msg_len > self.config["max_message_size"]:
-                    logger.warning(f"Message too large: {msg_len} bytes")
-                    await self._send_error(writer, "message_too_large", "Message exceeds maximum size")
-                    break
-                
-                # Read encrypted message
-                try:
-                    encrypted_msg = await asyncio.wait_for(
-                        reader.readexactly(msg_len),
-                        timeout=5.0
-                    )
-                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
-                    logger.warning(f"Failed to read message from {client_addr}")
-                    break
-                
-                # Decrypt and process message
-                try:
-                    decrypted_msg = self._decrypt(encrypted_msg)
-                    result = await self._handle_rpc(decrypted_msg)
-                    response = self._create_response(result=result)
-                except Exception as e:
-                    logger.error(f"Error processing RPC: {e}", exc_info=True)
-                    response = self._create_response(error={"code": "internal_error", "message": str(e)})
-                
-                # Send response
-                await self._send_encrypted(writer, response)
-                
-        except Exception as e:
-            logger.error(f"Connection {conn_id} error: {e}", exc_info=True)
-        finally:
-            writer.close()
-            try:
-                await writer.wait_closed()
-            except Exception:
-                pass
-            logger.info(f"Connection {conn_id} closed")
-    
     async def _handle_rpc(self, message: Dict) -> Any:
         """Handle an incoming RPC message."""
         method = message.get("method")
@@ -197,7 +355,7 @@ class DivineBus:
     
     async def _handle_ping(self, params: Dict) -> Dict:
         """Handle ping request."""
-        return {"status": "alive", "timestamp": asyncio.get_event_loop().time()}
+        return {"status": "alive", "timestamp": (self._loop or asyncio.get_running_loop()).time()}
     
     async def _handle_restart_module(self, params: Dict) -> Dict:
         """Handle module restart request."""
@@ -218,7 +376,7 @@ class DivineBus:
     async def _handle_sync_heartbeat(self, params: Dict) -> Dict:
         """Handle heartbeat synchronization."""
         # TODO: Implement heartbeat sync logic
-        return {"status": "synced", "timestamp": asyncio.get_event_loop().time()}
+        return {"status": "synced", "timestamp": (self._loop or asyncio.get_running_loop()).time()}
     
     async def _handle_send_alert(self, params: Dict) -> Dict:
         """Handle alert notification."""
@@ -236,11 +394,28 @@ class DivineBus:
         
         return {"status": "alert_sent", "message": message, "level": level}
     
+    def _load_nacl_backend(self) -> Optional[Tuple[Callable, Callable]]:
+        """Get libsodium's AES-256-GCM functions, or None if unusable here.
+        
+        Enabled with "crypto_backend": "nacl" in the Athena config. The wire
+        format (nonce || ciphertext || tag) is the same as with cryptography.
+        """
+        try:
+            from nacl.bindings import crypto_aead_aes256gcm_encrypt, crypto_aead_aes256gcm_decrypt
+            # libsodium only implements AES-GCM on CPUs with AES-NI; probe once
+            crypto_aead_aes256gcm_encrypt(b"", None, bytes(12), self.aes_key)
+        except Exception as e:
+            logger.warning(f"nacl AES-256-GCM backend unavailable, using cryptography: {e}")
+            return None
+        return crypto_aead_aes256gcm_encrypt, crypto_aead_aes256gcm_decrypt
+    
     def _encrypt(self, data: bytes) -> bytes:
         """Encrypt data using AES-GCM."""
-        aesgcm = AESGCM(self.aes_key)
         nonce = os.urandom(12)  # 96-bit nonce for GCM
-        ct = aesgcm.encrypt(nonce, data, None)
+        if self._nacl is None:
+            ct = self._aesgcm.encrypt(nonce, data, None)
+        else:
+            ct = self._nacl[0](data, None, nonce, self.aes_key)
         return nonce + ct  # Return nonce || ciphertext || tag
     
     def _decrypt(self, data: bytes) -> bytes:
@@ -251,10 +426,11 @@ class DivineBus:
         nonce = data[:12]
         ct = data[12:]
         
-        aesgcm = AESGCM(self.aes_key)
         try:
-            return aesgcm.decrypt(nonce, ct, None)
-        except InvalidTag:
+            if self._nacl is None:
+                return self._aesgcm.decrypt(nonce, ct, None)
+            return self._nacl[1](bytes(ct), None, bytes(nonce), self.aes_key)
+        except (InvalidTag, _NaclCryptoError):
             raise ValueError("Invalid authentication tag")
     
     def _create_response(self, result: Any = None, error: Dict = None) -> Dict:
@@ -271,30 +447,24 @@ class DivineBus:
             
         return response
     
-    async def _send_encrypted(self, writer: asyncio.StreamWriter, data: Dict):
-        """Send encrypted JSON-RPC response."""
-        try:
-            json_data = json.dumps(data).encode('utf-8')
-            encrypted = self._encrypt(json_data)
-            
-            # Send message length (4 bytes, big-endian)
-            writer.write(struct.pack('>I', len(encrypted)))
-            
-            # Send encrypted message
-            writer.write(encrypted)
-            await writer.drain()
-            
-        except Exception as e:
-            logger.error(f"Failed to send response: {e}", exc_info=True)
-            raise
+    def _decode_message(self, payload: bytes) -> Tuple[Dict, Callable]:
+        """Decode a decrypted request and return it with the encoder for its reply.
+        
+        A JSON request starts with '{' and a msgpack one with a map marker, so
+        both formats are accepted on the same port and answered in kind.
+        """
+        first = payload[0]
+        if _unpackb is not None and (0x80 <= first <= 0x8f or first in (0xde, 0xdf)):
+            return _unpackb(payload), _packb
+        return _loads(payload), _dumps
     
-    async def _send_error(self, writer: asyncio.StreamWriter, code: str, message: str):
-        """Send an error response and close the connection."""
-        error = {"code": code, "message": message}
-        response = self._create_response(error=error)
-        await self._send_encrypted(writer, response)
-        writer.close()
-        await writer.wait_closed()
+    def _encode_frame(self, data: Dict, dumps: Optional[Callable] = None) -> bytes:
+        """Encrypt a JSON-RPC message and prefix it with its length (4 bytes, big-endian).
+        
+        The message is serialized with dumps, or the configured wire format.
+        """
+        encrypted = self._encrypt((dumps or self._dumps)(data))
+        return struct.pack('>I', len(encrypted)) + encrypted
 
 
 # Singleton instance
@@ -1,5 +1,6 @@
 import os
 import subprocess
+import zipfile
 
 class FullFirmwareRebirth:
     def __init__(self, device_id, ipsw_path, shsh_blob_path, output_path, branding):
@@ -13,9 +14,8 @@ class FullFirmwareRebirth:
         # Phase 1: Extract the IPSW structure
         print("[LilithOSi] Extracting IPSW payload...")
         os.makedirs('work/ipsw', exist_ok=True)
-        subprocess.run([
-            'unzip', '-o', self.ipsw_path, '-d', 'work/ipsw'
-        ], check=True)
+        with zipfile.ZipFile(self.ipsw_path) as ipsw:
+            ipsw.extractall('work/ipsw')
 
     def patch_components(self):
         # Phase 2: Modify core components (placeholder)
@@ -38,9 +38,12 @@ class FullFirmwareRebirth:
     def rebuild_ipsw(self):
         # Phase 4: Repackage as LilithOSi IPSW
         print(f"[LilithOSi] Rebuilding IPSW as {self.output_path} with branding {self.branding}...")
-        subprocess.run([
-            'zip', '-r', self.output_path, '.',
-        ], cwd='work/signed_ipsw', check=True)
+        src_dir = 'work/signed_ipsw'
+        with zipfile.ZipFile(self.output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as ipsw:
+            for root, _, files in os.walk(src_dir):
+                for name in files:
+                    path = os.path.join(root, name)
+                    ipsw.write(path, os.path.relpath(path, src_dir))
 
     def run_all(self):
         self.extract_payload()
@@ -0,0 +1,214 @@
+"""
+Tests for the DivineBus wire protocol (framing, decryption errors, flow control
+and timeouts). Run with: python -m unittest test_divinebus_protocol
+"""
+
+import asyncio
+import json
+import os
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.absolute()))
+
+from core import divine_bus as db
+
+
+class _FakeTransport(asyncio.Transport):
+    """Transport stub recording writes and read pausing."""
+
+    def __init__(self):
+        super().__init__()
+        self.written = []
+        self.reading = True
+        self.closed = False
+
+    def get_extra_info(self, name, default=None):
+        return default
+
+    def pause_reading(self):
+        self.reading = False
+
+    def resume_reading(self):
+        self.reading = True
+
+    def is_closing(self):
+        return self.closed
+
+    def write(self, data):
+        self.written.append(data)
+
+    def close(self):
+        self.closed = True
+
+
+class DivineBusProtocolTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        fd, self.config_path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({
+                "host": "127.0.0.1",
+                "port": 0,
+                "shared_secret": "test-secret",
+                "auth_timeout": 5.0,
+                "max_message_size": 4096,
+            }, f)
+        self.bus = db.DivineBus(self.config_path)
+        self.server_task = asyncio.create_task(self.bus.start())
+        while self.bus.server is None or not self.bus.server.sockets:
+            await asyncio.sleep(0.01)
+        self.port = self.bus.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        await self.bus.stop()
+        self.server_task.cancel()
+        try:
+            await self.server_task
+        except asyncio.CancelledError:
+            pass
+        os.unlink(self.config_path)
+
+    def frame(self, message) -> bytes:
+        payload = message if isinstance(message, bytes) else json.dumps(message).encode()
+        encrypted = self.bus._encrypt(payload)
+        return struct.pack('>I', len(encrypted)) + encrypted
+
+    async def read_response(self, reader):
+        length = struct.unpack('>I', await asyncio.wait_for(reader.readexactly(4), 2))[0]
+        return json.loads(self.bus._decrypt(await asyncio.wait_for(reader.readexactly(length), 2)))
+
+    async def connect(self):
+        return await asyncio.open_connection('127.0.0.1', self.port)
+
+    async def test_several_frames_in_one_read(self):
+        reader, writer = await self.connect()
+        writer.write(self.frame({"method": "ping"}) + self.frame({"method": "nope"}) +
+                     self.frame({"method": "send_alert", "params": {"message": "hi"}}))
+
+        self.assertEqual((await self.read_response(reader))["result"]["status"], "alive")
+        self.assertEqual((await self.read_response(reader))["error"]["code"], "internal_error")
+        self.assertEqual((await self.read_response(reader))["result"]["status"], "alert_sent")
+        writer.close()
+
+    async def test_split_frame(self):
+        reader, writer = await self.connect()
+        data = self.frame({"method": "ping"})
+        for chunk in (data[:2], data[2:9], data[9:]):
+            writer.write(chunk)
+            await writer.drain()
+            await asyncio.sleep(0.02)
+
+        self.assertEqual((await self.read_response(reader))["result"]["status"], "alive")
+        writer.close()
+
+    async def test_oversized_frame(self):
+        reader, writer = await self.connect()
+        writer.write(struct.pack('>I', 10_000_000))
+
+        self.assertEqual((await self.read_response(reader))["error"]["code"], "message_too_large")
+        self.assertEqual(await asyncio.wait_for(reader.read(), 2), b'')
+
+    async def test_bad_tag(self):
+        reader, writer = await self.connect()
+        writer.write(struct.pack('>I', 40) + os.urandom(40))
+
+        self.assertEqual((await self.read_response(reader))["error"]["code"], "invalid_message")
+        # The connection stays usable
+        writer.write(self.frame({"method": "ping"}))
+        self.assertEqual((await self.read_response(reader))["result"]["status"], "alive")
+        writer.close()
+
+    async def test_undecodable_payloads(self):
+        reader, writer = await self.connect()
+        writer.write(self.frame(b'not json') + self.frame(b'[1, 2]'))
+
+        self.assertEqual((await self.read_response(reader))["error"]["code"], "invalid_message")
+        self.assertEqual((await self.read_response(reader))["error"]["code"], "invalid_message")
+        writer.close()
+
+    async def test_idle_timeout(self):
+        with mock.patch.object(db, 'IDLE_TIMEOUT', 0.1):
+            reader, writer = await self.connect()
+            self.assertEqual(await asyncio.wait_for(reader.read(), 2), b'')
+
+    async def test_partial_frame_timeout(self):
+        with mock.patch.object(db, 'PARTIAL_MESSAGE_TIMEOUT', 0.1):
+            reader, writer = await self.connect()
+            writer.write(self.frame({"method": "ping"})[:3])
+            self.assertEqual(await asyncio.wait_for(reader.read(), 2), b'')
+
+    async def test_slow_handler_is_not_timed_out(self):
+        async def slow(params):
+            await asyncio.sleep(0.3)
+            return "done"
+        self.bus.register_handler("slow", slow)
+
+        with mock.patch.object(db, 'IDLE_TIMEOUT', 0.1):
+            reader, writer = await self.connect()
+            writer.write(self.frame({"method": "slow"}))
+            self.assertEqual((await self.read_response(reader))["result"], "done")
+            # The idle timeout applies again once the response is out
+            self.assertEqual(await asyncio.wait_for(reader.read(), 2), b'')
+
+    async def test_queue_limit_pauses_reading(self):
+        release = asyncio.Event()
+
+        async def blocked(params):
+            await release.wait()
+            return "ok"
+        self.bus.register_handler("blocked", blocked)
+
+        protocol = db._DivineBusProtocol(self.bus)
+        transport = _FakeTransport()
+        protocol.connection_made(transport)
+
+        for _ in range(db.MAX_QUEUED_MESSAGES + 4):
+            data = self.frame({"method": "blocked"})
+            protocol.get_buffer(len(data))[:len(data)] = data
+            protocol.buffer_updated(len(data))
+        self.assertFalse(transport.reading)
+
+        release.set()
+        for _ in range(100):
+            if len(transport.written) == db.MAX_QUEUED_MESSAGES + 4:
+                break
+            await asyncio.sleep(0.01)
+        self.assertTrue(transport.reading)
+        self.assertEqual(len(transport.written), db.MAX_QUEUED_MESSAGES + 4)
+
+        protocol.connection_lost(None)
+
+    async def test_paused_writing_holds_responses(self):
+        protocol = db._DivineBusProtocol(self.bus)
+        transport = _FakeTransport()
+        protocol.connection_made(transport)
+        protocol.pause_writing()
+
+        data = self.frame({"method": "ping"})
+        protocol.get_buffer(len(data))[:len(data)] = data
+        protocol.buffer_updated(len(data))
+        await asyncio.sleep(0.05)
+        self.assertEqual(transport.written, [])
+
+        protocol.resume_writing()
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(transport.written), 1)
+
+        protocol.connection_lost(None)
+
+
+class DivineBusHandlerTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_handlers_work_without_start(self):
+        bus = db.DivineBus(config_path=os.path.join(tempfile.gettempdir(), "missing-athena.json"))
+        self.assertEqual((await bus._handle_ping({}))["status"], "alive")
+        self.assertEqual((await bus._handle_sync_heartbeat({}))["status"], "synced")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -34,7 +34,6 @@ Quantum-detailed Python daemon for Bluetooth mesh networking.
 """
 
 import threading
-import time
 import json
 import logging
 from typing import Dict, List, Optional
@@ -56,6 +55,8 @@ class WhispurrNetDaemon:
         self.whisper_channels: Dict[str, str] = {}
         self.running = True
         self.ota_triggers = []
+        self._stop_event = threading.Event()
+        self._peers_changed = threading.Event()
         
     def peer_discovery(self):
         """Discover and manage peer devices in the mesh network."""
@@ -63,27 +64,42 @@ class WhispurrNetDaemon:
         # TODO: Implement actual Bluetooth peer discovery
         # Example: scan for devices with WhispurrNet identifier
         while self.running:
-            # Simulate peer discovery
-            time.sleep(5)
-            logger.info("[WhispurrNet] Peer discovery cycle completed")
+            # Simulate peer discovery; wakes immediately on stop
+            if self._stop_event.wait(5):
+                break
+            # Discovered/lost peers go through add_peer()/remove_peer()
+            logger.debug("[WhispurrNet] Peer discovery cycle completed")
+    
+    def add_peer(self, peer_id: str, info: dict):
+        """Add or update a peer and wake the main loop."""
+        if peer_id not in self.peers:
+            logger.info("[WhispurrNet] Peer joined: %s", peer_id)
+        self.peers[peer_id] = info
+        self._peers_changed.set()
+    
+    def remove_peer(self, peer_id: str):
+        """Forget a peer and wake the main loop."""
+        if self.peers.pop(peer_id, None) is not None:
+            logger.info("[WhispurrNet] Peer left: %s", peer_id)
+            self._peers_changed.set()
     
     def signal_burst(self, message: str, target_peer: Optional[str] = None):
         """Send rapid signal burst to peer(s)."""
-        logger.info(f"[WhispurrNet] Signal burst: {message}")
+        logger.info("[WhispurrNet] Signal burst: %s", message)
         if target_peer:
-            logger.info(f"[WhispurrNet] Targeting peer: {target_peer}")
+            logger.info("[WhispurrNet] Targeting peer: %s", target_peer)
         # TODO: Implement actual signal burst transmission
         # Example: rapid Bluetooth packet transmission
     
     def whisper_channel(self, channel_id: str, message: str):
         """Send message through encrypted whisper channel."""
-        logger.info(f"[WhispurrNet] Whisper channel {channel_id}: {message}")
+        logger.info("[WhispurrNet] Whisper channel %s: %s", channel_id, message)
         self.whisper_channels[channel_id] = message
         # TODO: Implement encrypted channel transmission
     
     def ota_trigger(self, trigger_data: dict):
         """Handle OTA update triggers from network events."""
-        logger.info(f"[WhispurrNet] OTA trigger: {trigger_data}")
+        logger.info("[WhispurrNet] OTA trigger: %s", trigger_data)
         self.ota_triggers.append(trigger_data)
         # TODO: Integrate with OTA subsystem
         # Example: trigger_ota_update(trigger_data)
@@ -99,18 +115,25 @@ class WhispurrNetDaemon:
         
         try:
             while self.running:
-                # Main daemon loop
-                time.sleep(1)
+                # Sleep until the peer set changes (or the maintenance interval elapses)
+                if self._peers_changed.wait(timeout=60):
+                    self._peers_changed.clear()
                 
                 # Example: periodic mesh maintenance
-                if len(self.peers) > 0:
-                    logger.info(f"[WhispurrNet] Active peers: {len(self.peers)}")
+                if self.peers:
+                    logger.debug("[WhispurrNet] Active peers: %d", len(self.peers))
                     
         except KeyboardInterrupt:
             logger.info("[WhispurrNet] Daemon stopping...")
-            self.running = False
+            self.stop()
         
         logger.info("[WhispurrNet] Daemon stopped")
+    
+    def stop(self):
+        """Stop the daemon; the main loop and peer discovery wake immediately."""
+        self.running = False
+        self._stop_event.set()
+        self._peers_changed.set()
 
 def main():
     """Main entry point for WhispurrNet daemon."""